@@ -868,33 +868,34 @@ async def proxy_docs_request(base_url: str, docs_path: str, request: Request) ->
     # Получаем тело запроса
     body = await request.body()
 
-    # Выполняем запрос к сервису
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        try:
-            logger.debug(f"Отправка {method} запроса на {target_url}")
-            response = await client.request(
-                method=method,
-                url=target_url,
-                headers=headers,
-                params=params,
-                content=body,
-                timeout=10.0  # Устанавливаем таймаут
-            )
-            logger.debug(f"Получен ответ от {target_url}: статус={response.status_code}")
-
-            # Создаем ответ FastAPI
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get('content-type')
-            )
-        except Exception as e:
-            # Логируем ошибку
-            logger.error(f"Error proxying docs request to {target_url}: {str(e)}")
-            # Возвращаем ошибку сервера
-            return Response(
-                content=json.dumps({"detail": f"Documentation unavailable: {str(e)}"}),
-                status_code=503,
-                media_type="application/json"
-            )
+    # Выполняем запрос к сервису через общий клиент
+    client = await get_http_client()
+    try:
+        logger.debug(f"Отправка {method} запроса на {target_url}")
+        response = await client.request(
+            method=method,
+            url=target_url,
+            headers=headers,
+            params=params,
+            content=body,
+            timeout=10.0,  # Устанавливаем таймаут
+            follow_redirects=True
+        )
+        logger.debug(f"Получен ответ от {target_url}: статус={response.status_code}")
+
+        # Создаем ответ FastAPI
+        return Response(
+            content=response.content,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            media_type=response.headers.get('content-type')
+        )
+    except Exception as e:
+        # Логируем ошибку
+        logger.error(f"Error proxying docs request to {target_url}: {str(e)}")
+        # Возвращаем ошибку сервера
+        return Response(
+            content=json.dumps({"detail": f"Documentation unavailable: {str(e)}"}),
+            status_code=503,
+            media_type="application/json"
+        )
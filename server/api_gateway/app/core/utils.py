@@ -1,8 +1,8 @@
 import asyncio
 from typing import Dict, Any, Optional
 
-import httpx
 from app.core.config import settings
+from app.core.proxy import get_http_client
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import RedirectResponse
 
@@ -34,48 +34,48 @@ async def check_service_health(service_url: str, service_name: str) -> Dict[str,
         service_url = service_url[:-1]
 
     try:
-        # Сокращаем общий таймаут
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            # Проверяем эндпоинты параллельно
-            tasks = []
-            for endpoint in health_endpoints:
-                url = f"{service_url}{endpoint}"
-                tasks.append(client.get(url, timeout=1.0))
-
-            # Ждем результаты, игнорируя ошибки
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Обрабатываем результаты
-            for i, result in enumerate(responses):
-                # Пропускаем исключения
-                if isinstance(result, Exception):
-                    continue
-
-                # Если нашли рабочий эндпоинт
-                if result.status_code == 200:
-                    endpoint = health_endpoints[i]
-                    logger.debug(f"{service_name} is healthy at {endpoint}")
-                    return {
-                        "status": "ok",
-                        "message": f"Service is healthy",
-                        "endpoint": endpoint,
-                        "version": result.headers.get("X-API-Version", "unknown")
-                    }
-
-            # Если до сих пор ничего не сработало, пробуем быстро корневой URL
-            try:
-                response = await client.get(service_url, timeout=0.5)
-                if response.status_code < 500:  # Любой ответ, кроме серверной ошибки
-                    return {"status": "ok", "message": "Service is reachable"}
-            except:
-                pass
-
-            # Все проверки провалились
-            logger.warning(f"{service_name} is not healthy")
-            return {
-                "status": "error",
-                "message": f"Service is not responding on any health endpoint"
-            }
+        # Общий HTTP-клиент, таймауты задаются на каждый запрос
+        client = await get_http_client()
+        # Проверяем эндпоинты параллельно
+        tasks = []
+        for endpoint in health_endpoints:
+            url = f"{service_url}{endpoint}"
+            tasks.append(client.get(url, timeout=1.0))
+
+        # Ждем результаты, игнорируя ошибки
+        responses = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Обрабатываем результаты
+        for i, result in enumerate(responses):
+            # Пропускаем исключения
+            if isinstance(result, Exception):
+                continue
+
+            # Если нашли рабочий эндпоинт
+            if result.status_code == 200:
+                endpoint = health_endpoints[i]
+                logger.debug(f"{service_name} is healthy at {endpoint}")
+                return {
+                    "status": "ok",
+                    "message": f"Service is healthy",
+                    "endpoint": endpoint,
+                    "version": result.headers.get("X-API-Version", "unknown")
+                }
+
+        # Если до сих пор ничего не сработало, пробуем быстро корневой URL
+        try:
+            response = await client.get(service_url, timeout=0.5)
+            if response.status_code < 500:  # Любой ответ, кроме серверной ошибки
+                return {"status": "ok", "message": "Service is reachable"}
+        except:
+            pass
+
+        # Все проверки провалились
+        logger.warning(f"{service_name} is not healthy")
+        return {
+            "status": "error",
+            "message": f"Service is not responding on any health endpoint"
+        }
     except Exception as e:
         logger.error(f"Error checking {service_name}: {str(e)}")
         return {"status": "error", "message": f"Error: {str(e)}"}
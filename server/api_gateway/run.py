@@ -54,6 +54,7 @@ def main():
         port=port,
         log_level="error",  # Minimal uvicorn log level
         access_log=False,  # Disable uvicorn access logs
+        log_config=None,  # Keep uvicorn from reconfiguring our logging
         use_colors=False  # Disable uvicorn colors for Rich compatibility
     )
 
@@ -2,10 +2,10 @@
 Logging redirects to common logger module
 """
 
-from common.logger import get_logger, initialize_logging
+from common.logger import get_logger as _get_common_logger, initialize_logging
 
 # Create service logger
-logger = get_logger("auth_service.core.logging")
+logger = _get_common_logger("auth_service.core.logging")
 
 
 def setup_logging(level: str = "info", enable_file_logging: bool = True, config_path: str = None) -> None:
@@ -35,7 +35,7 @@ def get_logger(name: str):
     if not name.startswith("auth_service."):
         name = f"auth_service.{name}"
 
-    return get_logger(name)
+    return _get_common_logger(name)
 
 
 # Function for request logging
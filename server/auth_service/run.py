@@ -151,6 +151,7 @@ def main():
             port=port,
             log_level="critical",  # Минимальный уровень логов
             access_log=False,  # Отключаем access logs
+            log_config=None,  # Не даем uvicorn перенастраивать логирование
             use_colors=False  # Отключаем цвета для чистоты логов
         )
     except Exception as e:
@@ -2,34 +2,30 @@
 Config module for logger setup
 """
 
-import logging
+import re
 from dataclasses import dataclass
 from datetime import timezone, timedelta, datetime
-from pathlib import Path
-from typing import List, Optional, Any
+from typing import Dict, Optional, Any
 
 from rich.theme import Theme
 
 # Application timezone (UTC+6)
 APP_TIMEZONE = timezone(timedelta(hours=6))
 
+# SQL keywords that start a new line in formatted SQL errors
+_SQL_KW_RE = re.compile(r'\b(VALUES|FROM|WHERE|JOIN|GROUP BY|ORDER BY)\b')
 
-@dataclass
+
+@dataclass(slots=True, init=False)
 class LoggerConfig:
     """
     Configuration class for logger setup
     """
-    handlers: List[Any]
-    level: int = logging.INFO
-    format: Optional[str] = None
-    date_format: Optional[str] = None
-    console_width: int = 120
-    markup: bool = True
-    rich_tracebacks: bool = True
-    tracebacks_show_locals: bool = True
-    show_time: bool = False
-    service_name: str = "service"
-    log_file: Optional[Path] = None
+    service_name: str
+    level: str
+    format_string: Optional[str]
+    log_file: Optional[str]
+    extra_kwargs: Dict[str, Any]
 
     def __init__(
             self,
@@ -99,6 +95,10 @@ def format_sql_error(error_msg: str) -> str:
     if not isinstance(error_msg, str) or not error_msg:
         return str(error_msg)
 
+    # Короткие сообщения не форматируются, нормализация пробелов им не нужна
+    if len(error_msg) <= 100:
+        return error_msg
+
     # Заменяем множественные пробелы на один
     msg = ' '.join(error_msg.split())
 
@@ -113,12 +113,7 @@ def format_sql_error(error_msg: str) -> str:
 
             # Форматируем SQL запрос
             sql_part = sql_part.replace('[SQL:', '\n[SQL:')
-            sql_part = sql_part.replace('VALUES', '\nVALUES')
-            sql_part = sql_part.replace('FROM', '\nFROM')
-            sql_part = sql_part.replace('WHERE', '\nWHERE')
-            sql_part = sql_part.replace('JOIN', '\nJOIN')
-            sql_part = sql_part.replace('GROUP BY', '\nGROUP BY')
-            sql_part = sql_part.replace('ORDER BY', '\nORDER BY')
+            sql_part = _SQL_KW_RE.sub(r'\n\1', sql_part)
 
             # Если есть параметры, добавляем их на новой строке
             params_start = sql_part.find('[parameters:')
@@ -24,26 +24,24 @@ class LogInterceptor:
         """Intercept logs from the specified loggers."""
         for name in self.logger_names:
             logger = logging.getLogger(name)
-            # Save original handlers
-            self.original_handlers[name] = list(logger.handlers)
-            # Remove all handlers
+            # Save original state
+            self.original_handlers[name] = (
+                logger.handlers, logger.propagate, logger.disabled, logger.level
+            )
+            # Remove all handlers and disable propagation to parent loggers
             logger.handlers = []
-            # Disable propagation to parent loggers
             logger.propagate = False
-            # Set level to CRITICAL to minimize logging
-            logger.setLevel(logging.CRITICAL)
-            # Add null handler
-            logger.addHandler(logging.NullHandler())
-            # Completely disable logger
+            # A disabled logger drops records before any handler is called
             logger.disabled = True
 
     def restore(self):
-        """Restore original handlers for the intercepted loggers."""
-        for name, handlers in self.original_handlers.items():
+        """Restore original state for the intercepted loggers."""
+        for name, (handlers, propagate, disabled, level) in self.original_handlers.items():
             logger = logging.getLogger(name)
             logger.handlers = handlers
-            logger.propagate = True
-            logger.disabled = False
+            logger.propagate = propagate
+            logger.disabled = disabled
+            logger.setLevel(level)
 
 
 def create_uvicorn_interceptor() -> LogInterceptor:
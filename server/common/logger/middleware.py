@@ -11,8 +11,6 @@ from fastapi import FastAPI, Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.types import ASGIApp
 
-from common.logger.config import format_log_time
-
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for logging HTTP requests and responses."""
@@ -35,97 +33,93 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         """
         super().__init__(app)
         self.logger = logger
-        self.exclude_paths = exclude_paths or ['/docs', '/redoc', '/openapi.json', '/healthz']
+        # Tuples let str.startswith do the prefix scan in a single call
+        self.exclude_paths = tuple(exclude_paths or ('/docs', '/redoc', '/openapi.json', '/healthz'))
+        self._auth_prefixes = ('/auth', '/api/v1/auth', '/login', '/register')
         self.log_request_headers = log_request_headers
 
     async def dispatch(
             self, request: Request, call_next: RequestResponseEndpoint
     ) -> Response:
         """Process the request and log information."""
-        # Get client IP and request ID
-        client_ip = request.client.host if request.client else "unknown"
-        request_id = request.headers.get("X-Request-ID", "")
-
-        # Get formatted timestamp
-        current_time = format_log_time()
-
-        # Extract URL path and method
+        # Don't log (or time) requests to excluded paths
         path = request.url.path
-        method = request.method
+        if path.startswith(self.exclude_paths):
+            return await call_next(request)
 
-        # Don't log requests to excluded paths
-        should_log = not any(path.startswith(p) for p in self.exclude_paths)
+        method = request.method
 
         # Start timer for request duration
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
+
+        # Only build the request record if a handler will actually accept it
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Get client IP and request ID
+            client_ip = request.client.host if request.client else "unknown"
+            request_id = request.headers.get("X-Request-ID", "")
 
-        if should_log:
             # Log basic request info
             user_agent = request.headers.get("User-Agent", "unknown")
-            referer = request.headers.get("Referer", "-")
+            if len(user_agent) > 30:
+                user_agent = user_agent[:30] + "..."
 
-            # Truncate useragent if it's too long
-            user_agent_short = user_agent[:30] + "..." if len(user_agent) > 30 else user_agent
+            request_id_part = f" ID:[dim]{request_id}[/dim]" if request_id else ""
 
-            log_message = (
-                f"[request]{method}[/request] [cyan]{path}[/cyan] - "
-                f"IP:[blue]{client_ip}[/blue]"
+            self.logger.debug(
+                "[request]%s[/request] [cyan]%s[/cyan] - IP:[blue]%s[/blue]%s UA:[dim]%s[/dim]",
+                method, path, client_ip, request_id_part, user_agent
             )
 
-            if request_id:
-                log_message += f" ID:[dim]{request_id}[/dim]"
-
-            log_message += f" UA:[dim]{user_agent_short}[/dim]"
-
             # Log additional headers if requested
             if self.log_request_headers:
-                headers = "\n".join([f"  {k}: {v}" for k, v in request.headers.items()])
-                log_message += f"\nHeaders:\n{headers}"
-
-            self.logger.debug(log_message)
+                self.logger.debug(
+                    "Headers:\n%s", "\n".join(f"  {k}: {v}" for k, v in request.headers.items())
+                )
 
         try:
             # Process request
             response = await call_next(request)
 
-            # Calculate request duration
-            duration = time.time() - start_time
-            duration_ms = round(duration * 1000, 2)
-
-            # Log based on status code if we should log this path
-            if should_log:
-                if response.status_code >= 500:
-                    self.logger.critical(
-                        f"[critical]SERVER ERROR[/critical] [request]{method}[/request] "
-                        f"[cyan]{path}[/cyan] - [bold red]{response.status_code}[/bold red] ({duration_ms}ms)"
-                    )
-                elif response.status_code >= 400:
-                    self.logger.error(
-                        f"[error]CLIENT ERROR[/error] [request]{method}[/request] "
-                        f"[cyan]{path}[/cyan] - [bold red]{response.status_code}[/bold red] ({duration_ms}ms)"
-                    )
-                elif path.startswith(('/auth', '/api/v1/auth', '/login', '/register')):
-                    self.logger.info(
-                        f"[auth]AUTH REQUEST[/auth] [request]{method}[/request] "
-                        f"[cyan]{path}[/cyan] - [green]{response.status_code}[/green] ({duration_ms}ms)"
-                    )
-                else:
-                    self.logger.info(
-                        f"[response]{method}[/response] [cyan]{path}[/cyan] - "
-                        f"[green]{response.status_code}[/green] ({duration_ms}ms)"
-                    )
+            # Calculate request duration (ms with 0.01 precision)
+            duration_ms = (time.monotonic_ns() - start_ns) // 10_000 / 100
+
+            # Log based on status code
+            if response.status_code >= 500:
+                self.logger.critical(
+                    "[critical]SERVER ERROR[/critical] [request]%s[/request] "
+                    "[cyan]%s[/cyan] - [bold red]%s[/bold red] (%sms)",
+                    method, path, response.status_code, duration_ms
+                )
+            elif response.status_code >= 400:
+                self.logger.error(
+                    "[error]CLIENT ERROR[/error] [request]%s[/request] "
+                    "[cyan]%s[/cyan] - [bold red]%s[/bold red] (%sms)",
+                    method, path, response.status_code, duration_ms
+                )
+            elif path.startswith(self._auth_prefixes):
+                self.logger.info(
+                    "[auth]AUTH REQUEST[/auth] [request]%s[/request] "
+                    "[cyan]%s[/cyan] - [green]%s[/green] (%sms)",
+                    method, path, response.status_code, duration_ms
+                )
+            else:
+                self.logger.info(
+                    "[response]%s[/response] [cyan]%s[/cyan] - "
+                    "[green]%s[/green] (%sms)",
+                    method, path, response.status_code, duration_ms
+                )
 
             return response
 
         except asyncio.CancelledError:
             self.logger.warning(
-                f"[yellow]Request cancelled: {method} {path}[/yellow]"
+                "[yellow]Request cancelled: %s %s[/yellow]", method, path
             )
             raise  # Re-raise to allow proper handling
 
         except Exception as e:
             self.logger.error(
-                f"[bold red]Request error: {method} {path} - {str(e)}[/bold red]"
+                "[bold red]Request error: %s %s - %s[/bold red]", method, path, e
             )
             raise  # Re-raise to allow FastAPI to handle the exception
 
@@ -3,10 +3,12 @@ Module for setting up logging in microservices
 """
 
 import asyncio
+import inspect
 import logging
 import os
+import re
+import threading
 from contextlib import asynccontextmanager
-from functools import lru_cache, wraps
 from typing import Optional, Dict, Any, Callable, TypeVar
 
 from rich.console import Console
@@ -21,8 +23,42 @@ F = TypeVar('F', bound=Callable[..., Any])
 # Global console instance
 console = Console(theme=get_default_theme())
 
+# RichHandler constructor parameters, inspected once for compatibility
+# with different rich versions
+_RICH_PARAMS = frozenset(inspect.signature(RichHandler.__init__).parameters)
+
+# RichHandler keyword arguments shared by all services (console is per call)
+_BASE_RICH_KWARGS: Dict[str, Any] = {
+    'show_time': True,
+    'show_path': False,
+    'show_level': True,
+    'markup': True,
+    'rich_tracebacks': True,
+    'tracebacks_show_locals': False,
+    'omit_repeated_times': False,
+    'log_time_format': "%d.%m.%Y %H:%M:%S",
+}
+
+# Проверяем наличие дополнительных параметров в сигнатуре
+if 'highlighter' in _RICH_PARAMS:
+    _BASE_RICH_KWARGS['highlighter'] = None
+
+if 'enable_link_path' in _RICH_PARAMS:
+    _BASE_RICH_KWARGS['enable_link_path'] = False
+
+if 'word_wrap' in _RICH_PARAMS:
+    _BASE_RICH_KWARGS['word_wrap'] = True
+
 # Cache for loggers to avoid recreation
 _loggers: Dict[str, logging.Logger] = {}
+# Guards logger creation; cache hits stay lock-free
+_loggers_lock = threading.Lock()
+
+# Library loggers silenced by setup_rich_logger
+_SILENCED_LOGGERS = ("uvicorn", "uvicorn.access", "uvicorn.error", "fastapi", "httpx", "asyncio")
+
+# Detects messages that look like SQL/SQLAlchemy errors in a single scan
+_SQL_DETECT_RE = re.compile(r'SQL:|sqlalchemy', re.IGNORECASE)
 
 
 class SqlFormattingLogger(logging.Logger):
@@ -30,13 +66,13 @@ class SqlFormattingLogger(logging.Logger):
 
     def error(self, msg: Any, *args, **kwargs):
         """Format SQL error messages before logging"""
-        if isinstance(msg, str) and ('SQL:' in msg or 'sqlalchemy' in msg.lower()):
+        if isinstance(msg, str) and _SQL_DETECT_RE.search(msg):
             msg = format_sql_error(msg)
         super().error(msg, *args, **kwargs)
 
     def critical(self, msg: Any, *args, **kwargs):
         """Format SQL error messages before logging"""
-        if isinstance(msg, str) and ('SQL:' in msg or 'sqlalchemy' in msg.lower()):
+        if isinstance(msg, str) and _SQL_DETECT_RE.search(msg):
             msg = format_sql_error(msg)
         super().critical(msg, *args, **kwargs)
 
@@ -56,42 +92,29 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-    if name in _loggers:
-        return _loggers[name]
-
-    # If logger is not in cache, create a new one
-    logger = logging.getLogger(name)
-
-    # Cast to SqlFormattingLogger to help type checking
-    if isinstance(logger, SqlFormattingLogger):
-        sql_logger = logger
-    else:
-        # Если стандартный логгер уже был создан до регистрации нашего класса,
-        # мы не можем изменить его тип, но можем подменить методы
-        original_error = logger.error
-        original_critical = logger.critical
-
-        @wraps(original_error)
-        def wrapped_error(msg, *args, **kwargs):
-            if isinstance(msg, str) and ('SQL:' in msg or 'sqlalchemy' in msg.lower()):
-                msg = format_sql_error(msg)
-            return original_error(msg, *args, **kwargs)
-
-        @wraps(original_critical)
-        def wrapped_critical(msg, *args, **kwargs):
-            if isinstance(msg, str) and ('SQL:' in msg or 'sqlalchemy' in msg.lower()):
-                msg = format_sql_error(msg)
-            return original_critical(msg, *args, **kwargs)
-
-        logger.error = wrapped_error
-        logger.critical = wrapped_critical
-        sql_logger = logger
-
-    _loggers[name] = sql_logger
-    return sql_logger
-
-
-@lru_cache
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
+
+    with _loggers_lock:
+        logger = _loggers.get(name)
+        if logger is not None:
+            return logger
+
+        # If logger is not in cache, create a new one
+        logger = logging.getLogger(name)
+
+        # Loggers created before our class was registered are plain Logger
+        # instances; switching their class keeps SQL formatting without
+        # per-call wrapper frames. Subclasses installed by third-party
+        # libraries are left as they are
+        if type(logger) is logging.Logger:
+            logger.__class__ = SqlFormattingLogger
+
+        _loggers[name] = logger
+        return logger
+
+
 def setup_rich_logger(
         service_name: str,
         log_level: int = logging.INFO,
@@ -110,101 +133,73 @@ def setup_rich_logger(
     Returns:
         Configured logger instance
     """
-    if service_name in _loggers:
-        return _loggers[service_name]
-
-    # Create log directory if needed
-    if log_file:
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    logger = _loggers.get(service_name)
+    if logger is not None:
+        return logger
+
+    with _loggers_lock:
+        logger = _loggers.get(service_name)
+        if logger is not None:
+            return logger
+
+        # Create log directory if needed
+        if log_file:
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+
+        # Configure Rich console with theme
+        console = Console(theme=get_default_theme())
+
+        # Disable logging for uvicorn and other libraries
+        null_handler = logging.NullHandler()
+        for name in _SILENCED_LOGGERS:
+            logger = logging.getLogger(name)
+            logger.handlers = [null_handler]
+            logger.propagate = False
+
+        # Configure Rich handler for beautiful console output
+        rich_handler = RichHandler(console=console, **_BASE_RICH_KWARGS)
+
+        # Level for console output
+        rich_handler.setLevel(log_level)
+
+        # Configure basic logger configuration
+        handlers = [rich_handler]
+
+        # Add file handler if log path is specified
+        if log_file:
+            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler.setLevel(log_level)
+            file_formatter = logging.Formatter(
+                '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+            file_handler.setFormatter(file_formatter)
+            handlers.append(file_handler)
+
+        # Configure root logger (force=True removes previous root handlers)
+        logging.basicConfig(
+            level=log_level,
+            format="%(message)s",
+            handlers=handlers,
+            force=True
+        )
 
-    # Configure Rich console with theme
-    console = Console(theme=get_default_theme())
+        # Create and configure logger for the service
+        logger = logging.getLogger(service_name)
+        logger.setLevel(log_level)
 
-    # Disable logging for uvicorn and other libraries
-    for name in ["uvicorn", "uvicorn.access", "uvicorn.error",
-                 "fastapi", "httpx", "asyncio"]:
-        logger = logging.getLogger(name)
-        logger.handlers = []
+        # Remove any previously created handlers
+        logger.handlers.clear()
+        # Don't duplicate messages to root logger
         logger.propagate = False
-        logger.addHandler(logging.NullHandler())
-
-    # Configure Rich handler for beautiful console output
-    rich_kwargs = {
-        'console': console,
-        'show_time': True,
-        'show_path': False,
-        'show_level': True,
-        'markup': True,
-        'rich_tracebacks': True,
-        'tracebacks_show_locals': False,
-        'omit_repeated_times': False,
-        'log_time_format': "%d.%m.%Y %H:%M:%S",
-    }
-
-    # Проверяем поддержку дополнительных параметров
-    # для совместимости с разными версиями rich
-    import inspect
-
-    # Получаем сигнатуру конструктора RichHandler
-    rich_params = inspect.signature(RichHandler.__init__).parameters
-
-    # Проверяем наличие дополнительных параметров в сигнатуре
-    if 'highlighter' in rich_params:
-        rich_kwargs['highlighter'] = None
-
-    if 'enable_link_path' in rich_params:
-        rich_kwargs['enable_link_path'] = False
-
-    if 'word_wrap' in rich_params:
-        rich_kwargs['word_wrap'] = True
-
-    # Создаем handler с поддерживаемыми параметрами
-    rich_handler = RichHandler(**rich_kwargs)
-
-    # Level for console output
-    rich_handler.setLevel(log_level)
-
-    # Configure basic logger configuration
-    handlers = [rich_handler]
-
-    # Add file handler if log path is specified
-    if log_file:
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(log_level)
-        file_formatter = logging.Formatter(
-            '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
-        handlers.append(file_handler)
-
-    # Clear previous log handlers
-    logging.getLogger().handlers.clear()
-
-    # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        format="%(message)s",
-        handlers=handlers,
-        force=True
-    )
-
-    # Create and configure logger for the service
-    logger = logging.getLogger(service_name)
-    logger.setLevel(log_level)
-
-    # Remove any previously created handlers
-    logger.handlers.clear()
-    # Don't duplicate messages to root logger
-    logger.propagate = False
-    # Add handlers directly
-    for handler in handlers:
-        logger.addHandler(handler)
-
-    # Save logger in cache
-    _loggers[service_name] = logger
-
-    return logger
+        # Add handlers directly
+        for handler in handlers:
+            logger.addHandler(handler)
+
+        # Save logger in cache
+        _loggers[service_name] = logger
+
+        return logger
 
 
 # Async context manager for FastAPI lifespan function
@@ -10,6 +10,18 @@ import sys
 _logging_initialized = {}
 _pythonpath_warned = False  # Флаг для отслеживания сообщения о PYTHONPATH
 
+# Loggers of uvicorn and other libraries that are silenced on startup
+_LOGGERS_TO_SILENCE = (
+    "uvicorn", "uvicorn.access", "uvicorn.error",
+    "uvicorn.watchgram", "uvicorn.watchgram.watcher",
+    "uvicorn.reload", "uvicorn.statreload",  # For reload mode
+    "watchfiles", "watchfiles.main",  # File watching library
+    "fastapi", "httpx", "asyncio"
+)
+
+# A NullHandler has no state, so one instance is shared by all silenced loggers
+_NULL_HANDLER = logging.NullHandler()
+
 
 def initialize_logging(service_name, log_file=None):
     """
@@ -35,30 +47,19 @@ def initialize_logging(service_name, log_file=None):
     # Check if this is a uvicorn reload process
     is_reload_process = "UVICORN_RELOAD" in os.environ
 
-    # Disable logging for uvicorn and other libraries
-    loggers_to_silence = [
-        "uvicorn", "uvicorn.access", "uvicorn.error",
-        "uvicorn.watchgram", "uvicorn.watchgram.watcher",
-        "uvicorn.reload", "uvicorn.statreload",  # For reload mode
-        "watchfiles", "watchfiles.main",  # File watching library
-        "fastapi", "httpx", "asyncio"
-    ]
-
-    for name in loggers_to_silence:
-        logger = logging.getLogger(name)
-        logger.handlers = []
-        logger.propagate = False
-        logger.setLevel(logging.CRITICAL)  # Only critical errors
-        logger.addHandler(logging.NullHandler())
-
-    # Complete disabling of logs from watchfiles
-    logging.getLogger("watchfiles.main").disabled = True
-
-    # Clear existing logging settings
-    for handler in list(logging.root.handlers):
-        logging.root.removeHandler(handler)
+    # Library loggers are process-wide, silence them only once
+    if not _logging_initialized:
+        for name in _LOGGERS_TO_SILENCE:
+            logger = logging.getLogger(name)
+            logger.handlers = [_NULL_HANDLER]
+            logger.propagate = False
+            logger.setLevel(logging.CRITICAL)  # Only critical errors
+
+        # Complete disabling of logs from watchfiles
+        logging.getLogger("watchfiles.main").disabled = True
 
     # Temporary basic logging for messages during initialization
+    # (force=True also removes any existing root handlers)
     logging.basicConfig(level=logging.INFO, format='%(message)s', force=True)
     temp_logger = logging.getLogger("startup")
 
@@ -1,16 +1,18 @@
 """
 Dependencies for API endpoints
 """
+import time
 import uuid
-from datetime import datetime, timezone
-from typing import AsyncGenerator
+from collections import OrderedDict
+from typing import Any, AsyncGenerator, Dict, Tuple
 
 import jwt
 from app.core.config import settings
 from app.db.db import get_async_session
+from app.repositories.article import ArticleRepository
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jwt.exceptions import PyJWTError
+from jwt.exceptions import ExpiredSignatureError, PyJWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.logger import get_logger
@@ -21,6 +23,17 @@ logger = get_logger("course_service.api.deps")
 # Security scheme for JWT tokens
 security = HTTPBearer()
 
+# JWT validation settings, resolved once at import; PyJWT checks "exp" itself during decode
+_JWT_SECRET_KEY = settings.AUTH_SECRET_KEY
+_JWT_ALGORITHMS = ("HS256",)
+_JWT_OPTIONS = {"require": ["exp", "sub"]}
+
+# LRU cache of decoded token payloads: token -> (cache expiry, payload).
+# An entry is kept for at most _TOKEN_CACHE_TTL seconds and never past the token's "exp"
+_token_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_TOKEN_CACHE_TTL = 60
+_TOKEN_CACHE_MAX_SIZE = 10000
+
 
 # Dependency for getting DB session
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -34,6 +47,54 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def get_article_repo(db: AsyncSession = Depends(get_db)) -> ArticleRepository:
+    """
+    Get article repository dependency bound to the request's DB session
+
+    Args:
+        db: Database session
+
+    Returns:
+        ArticleRepository: Article repository
+    """
+    return ArticleRepository(db)
+
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and validate a JWT token, reusing recently decoded payloads
+
+    Args:
+        token: Raw JWT token
+
+    Returns:
+        Dict[str, Any]: Token payload
+
+    Raises:
+        PyJWTError: If token is invalid or expired
+    """
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        expires_at, payload = cached
+        if now < expires_at:
+            _token_cache.move_to_end(token)
+            return payload
+        _token_cache.pop(token, None)
+
+    payload = jwt.decode(
+        token,
+        _JWT_SECRET_KEY,
+        algorithms=_JWT_ALGORITHMS,
+        options=_JWT_OPTIONS
+    )
+
+    _token_cache[token] = (min(now + _TOKEN_CACHE_TTL, payload["exp"]), payload)
+    if len(_token_cache) > _TOKEN_CACHE_MAX_SIZE:
+        _token_cache.popitem(last=False)
+    return payload
+
+
 async def verify_token(
         credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> bool:
@@ -53,32 +114,17 @@ async def verify_token(
         HTTPException: If token is invalid or expired
     """
     try:
-        token = credentials.credentials
-        payload = jwt.decode(
-            token,
-            settings.AUTH_SECRET_KEY,
-            algorithms=["HS256"]
-        )
-
-        # Check if token is expired
-        exp = payload.get("exp")
-        if not exp:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token: missing expiration"
-            )
-
-        # If token has expired
-        if datetime.now(timezone.utc).timestamp() > exp:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token expired"
-            )
+        _decode_token(credentials.credentials)
 
         # Return user_id from token if needed
         # user_id = payload.get("sub")
 
         return True
+    except ExpiredSignatureError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token expired"
+        )
     except PyJWTError as e:
         logger.error(f"JWT validation error: {str(e)}")
         raise HTTPException(
@@ -109,12 +155,7 @@ async def get_current_user_id(
         HTTPException: If token is invalid or expired
     """
     try:
-        token = credentials.credentials
-        payload = jwt.decode(
-            token,
-            settings.AUTH_SECRET_KEY,
-            algorithms=["HS256"]
-        )
+        payload = _decode_token(credentials.credentials)
 
         # Get user ID from token
         user_id_str = payload.get("sub")
@@ -1,24 +1,65 @@
+from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
-from app.api.deps import get_current_user_id, get_db
+from app.api.deps import get_article_repo, get_current_user_id
 from app.repositories.article import ArticleRepository
-from app.repositories.course import CourseRepository
 from app.schemas.article import (
     ArticleCreate, ArticleResponse, ArticleUpdate, 
     ArticleListResponse, ArticleLocalizedResponse,
     ArticleLanguagesResponse
 )
-from fastapi import APIRouter, Depends, HTTPException, Query, status, Path
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status, Path
 
 router = APIRouter()
 
 
+def _article_etag(updated_at: datetime, variant: str) -> str:
+    """
+    Build a weak ETag for an article representation
+
+    Args:
+        updated_at: Last modification time of the article
+        variant: Representation of the article (e.g. "all" or a language code)
+
+    Returns:
+        ETag header value
+    """
+    return f'W/"{int(updated_at.timestamp() * 1_000_000)}-{variant}"'
+
+
+async def _not_modified(
+        request: Request,
+        article_repo: ArticleRepository,
+        article_id: UUID,
+        variant: str
+) -> Optional[Response]:
+    """
+    Answer 304 if the client's If-None-Match still matches the article
+
+    Only the updated_at column is read, and only when the client sent If-None-Match.
+
+    Returns:
+        304 response if the client's copy is current, None otherwise
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+
+    updated_at = await article_repo.get_article_version(article_id)
+    if updated_at is None:
+        return None
+
+    etag = _article_etag(updated_at, variant)
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
 @router.post("/", response_model=ArticleResponse, status_code=status.HTTP_201_CREATED)
 async def create_article(
         article_data: ArticleCreate,
-        db: AsyncSession = Depends(get_db),
+        article_repo: ArticleRepository = Depends(get_article_repo),
         current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
@@ -26,29 +67,6 @@ async def create_article(
     
     Expects title and content in at least one language.
     """
-    article_repo = ArticleRepository(db)
-    course_repo = CourseRepository(db)
-
-    # Check if course exists
-    course = await course_repo.get_course(article_data.course_id)
-    if not course:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Course with ID {article_data.course_id} not found"
-        )
-
-    # Check if article with the same slug already exists
-    existing_article = await article_repo.get_article_by_slug(
-        course_id=article_data.course_id,
-        slug=article_data.slug
-    )
-
-    if existing_article:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Article with this slug already exists for this course"
-        )
-
     # Validate that at least one language is provided for title and content
     if not article_data.title or len(article_data.title) == 0:
         raise HTTPException(
@@ -62,7 +80,20 @@ async def create_article(
             detail="Content must be provided in at least one language"
         )
 
+    # Check if course exists
+    if not await article_repo.course_exists(article_data.course_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Course with ID {article_data.course_id} not found"
+        )
+
+    # A taken slug is detected by the INSERT itself (ON CONFLICT DO NOTHING)
     article = await article_repo.create_article(article_data.course_id, article_data)
+    if not article:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Article with this slug already exists for this course"
+        )
     return article
 
 
@@ -73,7 +104,7 @@ async def list_articles(
         limit: int = Query(100, ge=1, le=100),
         language: Optional[str] = None,
         is_published: Optional[bool] = None,
-        db: AsyncSession = Depends(get_db),
+        article_repo: ArticleRepository = Depends(get_article_repo),
         current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
@@ -81,7 +112,6 @@ async def list_articles(
     
     If language is provided, only articles with content in that language will be included.
     """
-    article_repo = ArticleRepository(db)
     articles, total = await article_repo.get_articles(
         course_id=course_id,
         skip=skip,
@@ -89,26 +119,28 @@ async def list_articles(
         language=language,
         is_published=is_published
     )
-    
-    # Filter articles by language if specified
-    if language:
-        # Keep only articles that have the requested language
-        articles = [article for article in articles if language in article.available_languages()]
-        total = len(articles)
 
-    return ArticleListResponse(items=articles, total=total)
+    # Validated once against response_model by FastAPI
+    return {"items": articles, "total": total}
 
 
 @router.get("/{article_id}", response_model=ArticleResponse)
 async def get_article(
         article_id: UUID,
-        db: AsyncSession = Depends(get_db),
+        request: Request,
+        response: Response,
+        article_repo: ArticleRepository = Depends(get_article_repo),
         current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
     Get a specific article by ID with all available languages.
+
+    Supports conditional requests: a matching If-None-Match yields 304 Not Modified.
     """
-    article_repo = ArticleRepository(db)
+    not_modified = await _not_modified(request, article_repo, article_id, "all")
+    if not_modified:
+        return not_modified
+
     article = await article_repo.get_article(article_id)
 
     if not article:
@@ -117,15 +149,18 @@ async def get_article(
             detail="Article not found"
         )
 
+    response.headers["ETag"] = _article_etag(article.updated_at, "all")
     return article
 
 
 @router.get("/{article_id}/localized", response_model=ArticleLocalizedResponse)
 async def get_localized_article(
         article_id: UUID,
+        request: Request,
+        response: Response,
         language: str = Query(..., description="Language code (e.g., 'en', 'ru')"),
         fallback: bool = Query(True, description="Whether to fall back to another language if requested language not found"),
-        db: AsyncSession = Depends(get_db),
+        article_repo: ArticleRepository = Depends(get_article_repo),
         current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
@@ -133,43 +168,45 @@ async def get_localized_article(
     
     If fallback is True and the requested language is not available,
     content from another language will be returned.
+    Supports conditional requests: a matching If-None-Match yields 304 Not Modified.
     """
-    article_repo = ArticleRepository(db)
-    article = await article_repo.get_article(article_id)
+    variant = f"{language}-{'fallback' if fallback else 'strict'}"
+    not_modified = await _not_modified(request, article_repo, article_id, variant)
+    if not_modified:
+        return not_modified
 
-    if not article:
+    # Only the requested language leaves the database
+    localized = await article_repo.get_localized(article_id, language, fallback)
+
+    if not localized:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Article not found"
         )
     
     # Check if the requested language is available
-    available_languages = article.available_languages()
-    if language not in available_languages and not fallback:
+    if not localized.pop("has_language") and not fallback:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Article content not available in language '{language}'"
         )
     
-    # Get localized content
-    localized = article.get_localized_version(language, fallback)
-    
     # Add language to response
     localized["language"] = language
-    
-    return ArticleLocalizedResponse(**localized)
+
+    response.headers["ETag"] = _article_etag(localized["updated_at"], variant)
+    return localized
 
 
 @router.get("/{article_id}/languages", response_model=ArticleLanguagesResponse)
 async def get_article_languages(
         article_id: UUID,
-        db: AsyncSession = Depends(get_db),
+        article_repo: ArticleRepository = Depends(get_article_repo),
         current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
     Get all available languages for a specific article.
     """
-    article_repo = ArticleRepository(db)
     languages = await article_repo.get_article_languages(article_id)
     
     return ArticleLanguagesResponse(languages=languages)
@@ -179,7 +216,7 @@ async def get_article_languages(
 async def update_article(
         article_id: UUID,
         article_data: ArticleUpdate,
-        db: AsyncSession = Depends(get_db),
+        article_repo: ArticleRepository = Depends(get_article_repo),
         current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
@@ -187,74 +224,36 @@ async def update_article(
     
     Can update multilingual content for specific languages without affecting other languages.
     """
-    article_repo = ArticleRepository(db)
-
-    # Verify article exists
-    article = await article_repo.get_article(article_id)
-    if not article:
+    # Multilingual fields are merged with the stored languages by the repository;
+    # existence and slug conflicts are reported by the UPDATE itself
+    try:
+        updated_article = await article_repo.update_article(article_id, article_data)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if not updated_article:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Article not found"
         )
-
-    # If slug is changing, check for conflicts
-    if article_data.slug and article_data.slug != article.slug:
-        existing_article = await article_repo.get_article_by_slug(
-            course_id=article.course_id,
-            slug=article_data.slug
-        )
-
-        if existing_article and existing_article.id != article_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Another article with this slug already exists"
-            )
-    
-    # Special handling for multilingual fields to merge rather than replace
-    if article_data.title:
-        # Update only the languages provided, keep existing languages
-        merged_title = dict(article.title) if article.title else {}
-        merged_title.update(article_data.title)
-        article_data.title = merged_title
-    
-    if article_data.description:
-        # Update only the languages provided, keep existing languages
-        merged_description = dict(article.description) if article.description else {}
-        merged_description.update(article_data.description)
-        article_data.description = merged_description
-    
-    if article_data.content:
-        # Update only the languages provided, keep existing languages
-        merged_content = dict(article.content) if article.content else {}
-        merged_content.update(article_data.content)
-        article_data.content = merged_content
-
-    updated_article = await article_repo.update_article(article_id, article_data)
     return updated_article
 
 
 @router.delete("/{article_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_article(
         article_id: UUID,
-        db: AsyncSession = Depends(get_db),
+        article_repo: ArticleRepository = Depends(get_article_repo),
         current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
     Delete an article by ID.
     """
-    article_repo = ArticleRepository(db)
-
-    # Verify article exists
-    article = await article_repo.get_article(article_id)
-    if not article:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Article not found"
-        )
-
+    # A DELETE that matched no rows means the article does not exist
     success = await article_repo.delete_article(article_id)
     if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete article"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Article not found"
         )
@@ -1,18 +1,23 @@
 """
 API endpoints for courses
 """
+import base64
+import hashlib
+import json
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import orjson
 from app.api.deps import get_db, verify_token, get_current_user_id
-from app.crud.course import course_crud
-from app.models.course import CourseVisibility
+from app.cache import course_cache_tag, get_cached, invalidate_tag, set_cached
+from app.crud.course import course_crud, parse_course_id
 from app.schemas.course import (
     Course, CourseCreate, CourseList, CourseResponse, CourseUpdate,
-    CourseLanguageUpdate
+    CourseLanguageUpdate, CourseSearchParams, CourseVisibilityUpdate
 )
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, Response, status
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.logger import get_logger
@@ -20,22 +25,309 @@ from common.logger import get_logger
 # Set up logger
 logger = get_logger("course_service.api.courses")
 
-router = APIRouter()
+# Ответы курсов зависят от языка клиента (ставится на все ответы роутера, включая 304)
+_VARY = "Accept-Language"
+
+
+def _vary_headers(response: Response) -> None:
+    """
+    Mark responses as dependent on the client's language
+
+    Accept-Encoding is added by GZipMiddleware for the responses it compresses.
+
+    Args:
+        response: Outgoing response
+    """
+    response.headers["Vary"] = _VARY
+
+
+router = APIRouter(dependencies=[Depends(_vary_headers)])
 
 # Список зарезервированных slug, которые нельзя использовать для курсов
-RESERVED_SLUGS = [
+RESERVED_SLUGS: frozenset[str] = frozenset({
     "docs", "redoc", "openapi.json", "tag", "tags", "tree", "article", "articles",
     "lesson", "lessons", "api", "admin", "auth", "login", "logout", "register",
     "user", "users", "settings", "profile", "dashboard", "search"
-]
+})
+
+# Поля, которые меняются отдельным запросом update_visibility
+_VISIBILITY_FIELDS = {"visibility", "organization_id"}
+
+# Кэш каталога: страницы списка живут недолго и сбрасываются целиком при любом изменении курсов,
+# отдельные курсы хранятся под courses:id:<uuid> / courses:slug:<slug> и сбрасываются по тегу курса
+_COURSE_LIST_CACHE_TTL = 60
+_COURSE_LIST_TAG = "courses:listkeys"
+
+# Дерево курса собирается дорого и меняется редко; сбрасывается вместе с остальными записями курса
+_COURSE_TREE_CACHE_TTL = 300
+
+# HTTP-кэширование: списки могут отдаваться прокси/CDN, отдельные курсы всегда ревалидируются по ETag
+_COURSE_LIST_CACHE_CONTROL = "public, max-age=30, stale-while-revalidate=120"
+_COURSE_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+_COURSE_TREE_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+# Сериализатор для эндпоинтов, возвращающих List[CourseResponse] (поиск по тегу, курсы автора)
+_COURSE_RESPONSE_LIST = TypeAdapter(List[CourseResponse])
+
+
+def _course_list_key(params: Dict[str, Any]) -> str:
+    """
+    Build cache key for a page of the course list
+
+    Args:
+        params: Listing query parameters
+
+    Returns:
+        str: Cache key
+    """
+    digest = hashlib.blake2b(
+        json.dumps(params, sort_keys=True, default=str).encode(),
+        digest_size=16
+    ).hexdigest()
+    return f"courses:list:{digest}"
+
+
+def _serialize_courses(courses: List[Any]) -> str:
+    """
+    Serialize a list of courses as List[CourseResponse] JSON
+
+    Args:
+        courses: Course ORM objects
+
+    Returns:
+        str: JSON array
+    """
+    items = _COURSE_RESPONSE_LIST.validate_python(courses, from_attributes=True)
+    return _COURSE_RESPONSE_LIST.dump_json(items).decode()
+
+
+def _encode_cursor(course: Any) -> str:
+    """
+    Encode keyset cursor pointing after the given course
+
+    Args:
+        course: Last course of the page
+
+    Returns:
+        str: URL-safe cursor
+    """
+    payload = json.dumps([course.created_at.isoformat(), str(course.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode keyset cursor into (created_at, id)
+
+    Args:
+        cursor: Cursor from a previous CourseList.next_cursor
+
+    Returns:
+        Tuple[datetime, uuid.UUID]: Position of the last course of the previous page
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        created_at, course_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(created_at, str) or not isinstance(course_id, str):
+            raise ValueError("cursor parts must be strings")
+        position = datetime.fromisoformat(created_at)
+        course_uuid = uuid.UUID(course_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    # created_at хранится с часовым поясом; курсор без пояса считаем UTC, иначе сравнение кортежей упадет
+    if position.tzinfo is None:
+        position = position.replace(tzinfo=timezone.utc)
+    return position, course_uuid
+
+
+def _json_response(payload: str, response: Response) -> Response:
+    """
+    Return already serialized JSON as is
+
+    FastAPI would otherwise validate the returned model against response_model and
+    serialize it again. Headers set on the injected response are carried over.
+
+    Args:
+        payload: JSON produced by model_dump_json()
+        response: Injected response with the headers to send
+
+    Returns:
+        Response: JSON response
+    """
+    headers = {name: value for name, value in response.headers.items() if name != "content-length"}
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+async def _get_cached_course(key: str) -> Optional[CourseResponse]:
+    """
+    Get a single course from cache
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Optional[CourseResponse]: Cached course or None on miss
+    """
+    cached = await get_cached(key)
+    return CourseResponse.model_validate_json(cached) if cached else None
+
+
+async def _cache_course(course: Any) -> CourseResponse:
+    """
+    Serialize a course and store it in cache under both its ID and slug keys
+
+    Args:
+        course: Course model
+
+    Returns:
+        CourseResponse: Serialized course
+    """
+    response = CourseResponse.model_validate(course)
+    serialized = response.model_dump_json()
+    tag = course_cache_tag(response.id)
+    await set_cached(f"courses:id:{response.id}", serialized, tag=tag)
+    await set_cached(f"courses:slug:{response.slug}", serialized, tag=tag)
+    return response
+
+
+async def _resolve_course(
+        db: AsyncSession,
+        *,
+        course_id: Optional[uuid.UUID] = None,
+        slug: Optional[str] = None
+) -> Optional[CourseResponse]:
+    """
+    Get a single course through the shared cache, falling back to the database
+
+    All single-course GETs go through here, so one cache fill serves every entry point.
+    With both arguments the value may be either an ID or a slug (see get_by_id_or_slug).
+
+    Args:
+        db: Database session
+        course_id: Course ID
+        slug: Course slug
+
+    Returns:
+        Optional[CourseResponse]: Course or None if not found
+    """
+    cache_key = f"courses:id:{course_id}" if course_id is not None else f"courses:slug:{slug}"
+    cached_course = await _get_cached_course(cache_key)
+    if cached_course is not None:
+        return cached_course
+
+    if course_id is None:
+        course = await course_crud.get_by_slug(db, slug)
+    elif slug is None:
+        course = await course_crud.get_course(db, course_id)
+    else:
+        course = await course_crud.get_by_id_or_slug(db, slug)
+    if course is None:
+        return None
+    return await _cache_course(course)
+
+
+def _course_etag(course_id: uuid.UUID, updated_at: datetime, variant: str) -> str:
+    """
+    Build a weak ETag for a course representation
+
+    Args:
+        course_id: Course ID
+        updated_at: Last modification time of the course
+        variant: Representation of the course (e.g. "course" or "languages")
+
+    Returns:
+        str: ETag header value
+    """
+    return f'W/"{course_id}-{int(updated_at.timestamp() * 1_000_000)}-{variant}"'
+
+
+def _if_none_match(request: Request, etag: str) -> bool:
+    """
+    Check if the client's If-None-Match contains the ETag
+
+    Args:
+        request: Incoming request
+        etag: Current ETag
+
+    Returns:
+        bool: True if the client's copy is current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    return bool(if_none_match) and etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def _conditional_course(request: Request, response: Response, course: CourseResponse) -> Any:
+    """
+    Answer 304 if the client already has this version of the course, otherwise tag the response
+
+    Args:
+        request: Incoming request
+        response: Outgoing response
+        course: Course to return
+
+    Returns:
+        304 response or the course with ETag set
+    """
+    etag = _course_etag(course.id, course.updated_at, "course")
+    if _if_none_match(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Vary": _VARY})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _COURSE_CACHE_CONTROL
+    return course
+
+
+def _conditional_tree(request: Request, response: Response, serialized_tree: str) -> Any:
+    """
+    Answer 304 if the client already has this tree, otherwise return it with an ETag
+
+    The tree combines the course and its technology tree, so the ETag is a hash of the
+    serialized tree instead of a single updated_at.
+
+    Args:
+        request: Incoming request
+        response: Outgoing response
+        serialized_tree: Tree serialized to JSON
+
+    Returns:
+        304 response or the serialized tree as is, with ETag set
+    """
+    etag = f'W/"{hashlib.blake2b(serialized_tree.encode(), digest_size=16).hexdigest()}"'
+    if _if_none_match(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Vary": _VARY})
+    response.headers["ETag"] = etag
+    return _json_response(serialized_tree, response)
+
+
+async def _invalidate_course_cache(course_id: Optional[uuid.UUID] = None) -> None:
+    """
+    Drop cached course list pages and, if given, all cached entries of one course
+
+    Args:
+        course_id: ID of the changed course
+    """
+    tags = [_COURSE_LIST_TAG]
+    if course_id is not None:
+        tags.append(course_cache_tag(course_id))
+    await invalidate_tag(*tags)
 
 
 @router.get("/", response_model=Union[CourseList, CourseResponse])
 async def get_courses(
-        uuid: Optional[uuid.UUID] = Query(None, description="Get course by UUID"),
+        request: Request,
+        response: Response,
+        course_uuid: Optional[uuid.UUID] = Query(None, alias="uuid", description="Get course by UUID"),
         slug: Optional[str] = Query(None, description="Get course by slug"),
-        page: int = Query(0, ge=0, description="Page number (starting from 0)"),
+        page: int = Query(0, ge=0, deprecated=True, description="Page number (starting from 0), use cursor instead"),
         size: int = Query(31, ge=1, le=100, description="Page size"),
+        cursor: Optional[str] = Query(None, description="Cursor from next_cursor of the previous page"),
+        with_total: bool = Query(
+            False, description="Count all matching courses when paging by cursor (page mode always counts)"
+        ),
         search: Optional[str] = Query(None, description="Search query for filtering by title and description"),
         language: Optional[str] = Query(None, description="Language code for search (e.g., 'en', 'ru')"),
         sort_by: Optional[str] = Query("created_at", description="Field to sort by"),
@@ -60,7 +352,10 @@ async def get_courses(
 
     ### 2. Получение списка курсов с фильтрацией и пагинацией:
     - Базовый запрос: `GET /`
-    - С пагинацией: `GET /?page=0&size=10`
+    - С пагинацией: `GET /?size=10`, следующая страница: `GET /?size=10&cursor=<next_cursor>`
+      (устаревший вариант: `GET /?page=0&size=10`)
+    - При пагинации курсором total и pages равны null, если не передан `with_total=true`
+      (в режиме page они считаются всегда — на них опираются существующие клиенты)
     - С поиском: `GET /?search=programming&language=en`
     - По автору: `GET /?author_id=550e8400-e29b-41d4-a716-446655440000`
     - По тегам: `GET /?tag_ids=tag1&tag_ids=tag2`
@@ -68,31 +363,42 @@ async def get_courses(
     При отсутствии параметров uuid и slug эндпоинт вернет список курсов
     с учетом фильтров в формате CourseList с информацией о пагинации.
     """
-    logger.info(
-        f"Request to get courses with params: uuid={uuid}, slug={slug}, page={page}, size={size}, search={search}")
+    logger.debug(
+        "Request to get courses with params: uuid=%s, slug=%s, page=%s, size=%s, search=%s",
+        course_uuid, slug, page, size, search
+    )
 
     # Если указан UUID или slug, возвращаем один курс
-    if uuid is not None:
-        course = await course_crud.get_course(db, uuid)
+    if course_uuid is not None:
+        course = await _resolve_course(db, course_id=course_uuid)
         if course is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Course with UUID {uuid} not found"
+                detail=f"Course with UUID {course_uuid} not found"
             )
-        return course  # Возвращаем один курс (CourseResponse)
+        return _conditional_course(request, response, course)  # Возвращаем один курс (CourseResponse)
 
     if slug is not None:
-        course = await course_crud.get_by_slug(db, slug)
+        course = await _resolve_course(db, slug=slug)
         if course is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Course with slug '{slug}' not found"
             )
-        return course  # Возвращаем один курс (CourseResponse)
+        return _conditional_course(request, response, course)  # Возвращаем один курс (CourseResponse)
 
     # Если не указаны uuid и slug, возвращаем список курсов с фильтрацией
+    response.headers["Cache-Control"] = _COURSE_LIST_CACHE_CONTROL
+    cache_key = _course_list_key({
+        "page": page, "size": size, "cursor": cursor, "with_total": with_total,
+        "search": search, "language": language, "sort_by": sort_by, "sort_order": sort_order,
+        "author_id": author_id, "tag_ids": tag_ids, "from_date": from_date, "to_date": to_date
+    })
+    cached_list = await get_cached(cache_key)
+    if cached_list:
+        return _json_response(cached_list, response)
+
     # Build search params for more complex queries
-    from app.schemas.course import CourseSearchParams
     search_params = CourseSearchParams(
         search=search,
         language=language,
@@ -106,37 +412,60 @@ async def get_courses(
         is_published=None
     )
 
-    # Get courses with pagination
-    courses, total = await course_crud.search_courses(db, search_params, skip=page * size, limit=size)
+    # Get courses with pagination: keyset after the cursor, or the legacy OFFSET by page.
+    # Клиенты режима page листают по total/pages, поэтому там COUNT выполняется всегда;
+    # при курсоре без with_total берем на одну строку больше, чтобы узнать, есть ли следующая страница
+    after = _decode_cursor(cursor) if cursor else None
+    if after is not None:
+        page = 0
+    count_total = with_total or after is None
+    try:
+        courses, total = await course_crud.search_courses(
+            db, search_params, skip=page * size, limit=size if count_total else size + 1,
+            after=after, compute_total=count_total
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if count_total:
+        has_more = total > page * size + len(courses)
+        pages = (total + size - 1) // size  # Calculate total pages
+    else:
+        has_more = len(courses) > size
+        courses = courses[:size]
+        pages = None
 
     # Логируем результаты поиска
-    logger.info(f"Found {total} courses matching search criteria")
-
-    # Если курсы не найдены, возвращаем пустой список
-    if total == 0:
-        # Возвращаем пустой список с пагинацией
-        return CourseList(
-            items=[],
-            total=0,
-            page=page,
-            size=size,
-            pages=0
-        )
+    logger.debug("Found %s courses matching search criteria (total=%s)", len(courses), total)
 
-    pages = (total + size - 1) // size  # Calculate total pages
+    # Курсор на следующую страницу выдаем, только если после текущей страницы еще есть курсы
+    next_cursor = None
+    if courses and has_more and sort_by in (None, "created_at"):
+        next_cursor = _encode_cursor(courses[-1])
 
-    return CourseList(
+    result = CourseList(
         items=courses,
         total=total,
         page=page,
         size=size,
-        pages=pages
+        pages=pages,
+        next_cursor=next_cursor
     )
 
+    # Страница сериализуется один раз: эта же строка уходит в кэш и клиенту
+    payload = result.model_dump_json()
+    await set_cached(cache_key, payload, expire=_COURSE_LIST_CACHE_TTL, tag=_COURSE_LIST_TAG)
+    return _json_response(payload, response)
+
 
 @router.get("/{id_or_slug}", response_model=CourseResponse)
 async def get_course_flexible(
         id_or_slug: str,
+        request: Request,
+        response: Response,
         db: AsyncSession = Depends(get_db)
 ):
     """
@@ -152,29 +481,17 @@ async def get_course_flexible(
             detail=f"Not found. Reserved slug cannot be used as course identifier."
         )
 
-    logger.info(f"Request to get course with ID or slug: {id_or_slug}")
+    logger.debug("Request to get course with ID or slug: %s", id_or_slug)
 
-    # Try to parse as UUID first
-    try:
-        course_id = uuid.UUID(id_or_slug)
-        course = await course_crud.get_course(db, course_id)
-        if course is None:
-            logger.warning(f"Course with ID {course_id} not found")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Course with ID {course_id} not found"
-            )
-        return course
-    except ValueError:
-        # Not a valid UUID, try as slug
-        course = await course_crud.get_by_slug(db, id_or_slug)
-        if course is None:
-            logger.warning(f"Course with slug '{id_or_slug}' not found")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Course with ID or slug '{id_or_slug}' not found"
-            )
-        return course
+    # UUID-looking values share the cache entry with lookups by ID; ID and slug are matched in one query
+    course = await _resolve_course(db, course_id=parse_course_id(id_or_slug), slug=id_or_slug)
+    if course is None:
+        logger.warning("Course with ID or slug '%s' not found", id_or_slug)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Course with ID or slug '{id_or_slug}' not found"
+        )
+    return _conditional_course(request, response, course)
 
 
 @router.post("/", response_model=CourseResponse, status_code=status.HTTP_201_CREATED)
@@ -188,8 +505,8 @@ async def create_course(
 
     Authentication required. Author ID is automatically extracted from the authentication token.
     """
-    logger.info(f"Request to create a new course by user ID: {user_id}")
-    logger.info(f"Request body: {course_data}")
+    logger.debug("Request to create a new course by user ID: %s", user_id)
+    logger.debug("Request body: %s", course_data)
 
     # Добавляем ID автора из токена
     course_data["author_id"] = str(user_id)
@@ -199,9 +516,11 @@ async def create_course(
         course = CourseCreate(**course_data)
 
         # Создаем курс
-        return await course_crud.create(db, obj_in=course)
+        created_course = await course_crud.create(db, obj_in=course)
+        await _invalidate_course_cache()
+        return created_course
     except Exception as e:
-        logger.error(f"Error creating course: {str(e)}", exc_info=True)
+        logger.error("Error creating course: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Error creating course: {str(e)}"
@@ -228,57 +547,54 @@ async def update_course(
 
     Use the appropriate fields in your request body to update specific parts of the course.
     """
-    logger.info(f"Request to update course with ID: {course_id}")
-    logger.info(f"Update data: {course_update}")
-
-    # Get the existing course
-    course = await course_crud.get_course(db, course_id)
-    if not course:
-        logger.warning(f"Course with ID {course_id} not found")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Course with ID {course_id} not found"
-        )
+    logger.debug("Request to update course with ID: %s", course_id)
+    logger.debug("Update data: %s", course_update)
 
-    # Special handling for visibility settings
+    # Special handling for visibility settings: CourseVisibilityUpdate requires organization_id
+    # for ORGANIZATION and clears it for other levels, so the current course isn't needed
+    visibility_update = None
     if "visibility" in course_update:
-        visibility = course_update.get("visibility")
-
-        # Validate organization_id when visibility is ORGANIZATION
-        if visibility == CourseVisibility.ORGANIZATION and "organization_id" not in course_update:
+        try:
+            visibility_update = CourseVisibilityUpdate(
+                visibility=course_update["visibility"],
+                organization_id=course_update.get("organization_id")
+            )
+        except ValidationError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="organization_id is required when visibility is set to ORGANIZATION"
+                detail="; ".join(error["msg"] for error in e.errors())
             )
-
-        # Remove organization_id when switching to other visibility levels
-        elif visibility != CourseVisibility.ORGANIZATION and course.organization_id is not None:
-            course_update["organization_id"] = None
+        course_update["organization_id"] = visibility_update.organization_id
 
     try:
         # Create CourseUpdate object if needed, or directly use the dictionary
-        if all(key in CourseUpdate.__annotations__ for key in course_update.keys()):
+        if visibility_update is not None and course_update.keys() <= _VISIBILITY_FIELDS:
+            # Visibility-only change: a single UPDATE ... RETURNING
+            updated_course = await course_crud.update_visibility(db, course_id, visibility_update)
+        elif all(key in CourseUpdate.__annotations__ for key in course_update.keys()):
             update_obj = CourseUpdate(**course_update)
             updated_course = await course_crud.update_course(db, course_id, update_obj)
         else:
             # For metadata or partial updates
             updated_course = await course_crud.update_metadata(db, course_id, course_update)
-
-        if updated_course is None:
-            logger.warning(f"Course with ID {course_id} not found during update")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Course with ID {course_id} not found"
-            )
-
-        return updated_course
     except Exception as e:
-        logger.error(f"Error updating course: {str(e)}", exc_info=True)
+        logger.error("Error updating course: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Error updating course: {str(e)}"
         )
 
+    # Проверяем после try: иначе 404 перехватывался бы общим обработчиком и превращался в 400
+    if updated_course is None:
+        logger.warning("Course with ID %s not found during update", course_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Course with ID {course_id} not found"
+        )
+
+    await _invalidate_course_cache(course_id)
+    return updated_course
+
 
 @router.delete("/{course_id}", status_code=status.HTTP_200_OK)
 async def delete_course(
@@ -294,14 +610,15 @@ async def delete_course(
     Returns:
         JSON with operation status and details
     """
-    logger.info(f"Request to delete course with ID: {course_id}")
+    logger.debug("Request to delete course with ID: %s", course_id)
     success = await course_crud.delete_course(db, course_id)
     if not success:
-        logger.warning(f"Course with ID {course_id} not found")
+        logger.warning("Course with ID %s not found", course_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Course with ID {course_id} not found"
         )
+    await _invalidate_course_cache(course_id)
     return {
         "status": "success",
         "message": f"Course with ID {course_id} successfully deleted",
@@ -312,6 +629,7 @@ async def delete_course(
 @router.get("/tag/{tag}", response_model=List[CourseResponse])
 async def search_by_tag(
         tag: str,
+        response: Response,
         skip: int = Query(0, ge=0, description="Number of records to skip"),
         limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
         db: AsyncSession = Depends(get_db)
@@ -319,13 +637,23 @@ async def search_by_tag(
     """
     Get courses that have a specific tag
     """
-    logger.info(f"Request to search courses by tag: {tag}")
-    return await course_crud.search_courses_by_tag(db, tag, skip=skip, limit=limit)
+    logger.debug("Request to search courses by tag: %s", tag)
+    response.headers["Cache-Control"] = _COURSE_LIST_CACHE_CONTROL
+    cache_key = _course_list_key({"route": "tag", "tag": tag.lower(), "skip": skip, "limit": limit})
+    cached_list = await get_cached(cache_key)
+    if cached_list:
+        return _json_response(cached_list, response)
+
+    courses = await course_crud.search_courses_by_tag(db, tag, skip=skip, limit=limit)
+    payload = _serialize_courses(courses)
+    await set_cached(cache_key, payload, expire=_COURSE_LIST_CACHE_TTL, tag=_COURSE_LIST_TAG)
+    return _json_response(payload, response)
 
 
 @router.get("/author/{author_id}", response_model=List[CourseResponse])
 async def get_courses_by_author(
         author_id: uuid.UUID,
+        response: Response,
         skip: int = Query(0, ge=0, description="Number of records to skip"),
         limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
         db: AsyncSession = Depends(get_db)
@@ -333,10 +661,14 @@ async def get_courses_by_author(
     """
     Get all courses created by a specific author
     """
-    logger.info(f"Request to get courses by author: {author_id}")
+    logger.debug("Request to get courses by author: %s", author_id)
+    response.headers["Cache-Control"] = _COURSE_LIST_CACHE_CONTROL
+    cache_key = _course_list_key({"route": "author", "author_id": author_id, "skip": skip, "limit": limit})
+    cached_list = await get_cached(cache_key)
+    if cached_list:
+        return _json_response(cached_list, response)
 
     # Build search params
-    from app.schemas.course import CourseSearchParams
     search_params = CourseSearchParams(
         author_id=author_id,
         sort_by="created_at",
@@ -346,8 +678,12 @@ async def get_courses_by_author(
     )
 
     # Get courses with filter
-    courses, _ = await course_crud.search_courses(db, search_params, skip=skip, limit=limit)
-    return courses
+    courses, _ = await course_crud.search_courses(
+        db, search_params, skip=skip, limit=limit, compute_total=False
+    )
+    payload = _serialize_courses(courses)
+    await set_cached(cache_key, payload, expire=_COURSE_LIST_CACHE_TTL, tag=_COURSE_LIST_TAG)
+    return _json_response(payload, response)
 
 
 @router.put("/{course_id}/languages/{language}", response_model=CourseResponse)
@@ -365,7 +701,7 @@ async def update_course_language(
 
     This endpoint allows adding or updating course content in a specific language.
     """
-    logger.info(f"Request to update language '{language}' for course ID: {course_id}")
+    logger.debug("Request to update language '%s' for course ID: %s", language, course_id)
 
     # Validate that provided language code matches the path parameter
     if language_data.language != language:
@@ -374,15 +710,6 @@ async def update_course_language(
             detail=f"Language code in path ({language}) does not match language in request body ({language_data.language})"
         )
 
-    # Get the course
-    course = await course_crud.get_course(db, course_id)
-    if not course:
-        logger.warning(f"Course with ID {course_id} not found")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Course with ID {course_id} not found"
-        )
-
     # Update the language
     updated_course = await course_crud.update_course_language(
         db,
@@ -391,6 +718,13 @@ async def update_course_language(
         language_data.title,
         language_data.description
     )
+    if updated_course is None:
+        logger.warning("Course with ID %s not found", course_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Course with ID {course_id} not found"
+        )
+    await _invalidate_course_cache(course_id)
 
     return updated_course
 
@@ -409,26 +743,23 @@ async def delete_course_language(
 
     This endpoint allows removing course content in a specific language.
     """
-    logger.info(f"Request to delete language '{language}' for course ID: {course_id}")
+    logger.debug("Request to delete language '%s' for course ID: %s", language, course_id)
 
-    # Get the course
-    course = await course_crud.get_course(db, course_id)
-    if not course:
-        logger.warning(f"Course with ID {course_id} not found")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Course with ID {course_id} not found"
-        )
-
-    # Check if language exists
-    if language not in course.available_languages():
+    # Remove the language
+    updated_course = await course_crud.remove_course_language(db, course_id, language)
+    if updated_course is None:
+        # Nothing was updated: find out whether the course or the language is missing
+        if not await course_crud.exists(db, course_id):
+            logger.warning("Course with ID %s not found", course_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Course with ID {course_id} not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Language '{language}' not found for course"
         )
-
-    # Remove the language
-    updated_course = await course_crud.remove_course_language(db, course_id, language)
+    await _invalidate_course_cache(course_id)
 
     return updated_course
 
@@ -436,24 +767,35 @@ async def delete_course_language(
 @router.get("/{course_id}/languages", response_model=Dict[str, List[str]])
 async def get_course_languages(
         course_id: uuid.UUID,
+        request: Request,
+        response: Response,
         db: AsyncSession = Depends(get_db)
 ):
     """
     Get all available languages for a course
     """
-    logger.info(f"Request to get languages for course ID: {course_id}")
+    logger.debug("Request to get languages for course ID: %s", course_id)
 
-    # Get the course
-    course = await course_crud.get_course(db, course_id)
-    if not course:
-        logger.warning(f"Course with ID {course_id} not found")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Course with ID {course_id} not found"
-        )
+    # A course already in the shared cache answers without the database,
+    # otherwise only the language codes are read, not the whole course
+    course = await _get_cached_course(f"courses:id:{course_id}")
+    if course is not None:
+        languages, updated_at = course.available_languages(), course.updated_at
+    else:
+        result = await course_crud.get_languages(db, course_id)
+        if result is None:
+            logger.warning("Course with ID %s not found", course_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Course with ID {course_id} not found"
+            )
+        languages, updated_at = result
 
-    # Get available languages
-    languages = course.available_languages()
+    etag = _course_etag(course_id, updated_at, "languages")
+    if _if_none_match(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Vary": _VARY})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _COURSE_CACHE_CONTROL
 
     return {"languages": languages}
 
@@ -461,6 +803,8 @@ async def get_course_languages(
 @router.get("/{id_or_slug}/tree", response_model=Dict[str, Any])
 async def get_course_tree(
         id_or_slug: str,
+        request: Request,
+        response: Response,
         language: Optional[str] = Query(None, description="Language code for content"),
         db: AsyncSession = Depends(get_db)
 ):
@@ -469,31 +813,34 @@ async def get_course_tree(
 
     This includes the technology tree, sections, lessons, and other structured content.
     """
-    logger.info(f"Request to get course tree for ID or slug: {id_or_slug}")
+    logger.debug("Request to get course tree for ID or slug: %s", id_or_slug)
 
-    # First, get the course
-    try:
-        # Try as UUID
-        course_id = uuid.UUID(id_or_slug)
-    except ValueError:
-        # Try as slug
-        course = await course_crud.get_by_slug(db, id_or_slug)
-        if not course:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Course with slug '{id_or_slug}' not found"
-            )
-        course_id = course.id
-    else:
-        # We have a valid UUID, get the course
-        course = await course_crud.get_course(db, course_id)
-        if not course:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Course with ID {course_id} not found"
-            )
+    response.headers["Cache-Control"] = _COURSE_TREE_CACHE_CONTROL
+
+    # A cached tree of a UUID-addressed course is served without touching the database
+    course_id = parse_course_id(id_or_slug)
+    if course_id is not None:
+        cached_tree = await get_cached(f"courses:tree:{course_id}:{language or '*'}")
+        if cached_tree:
+            return _conditional_tree(request, response, cached_tree)
 
-    # Get the course tree
-    tree = await course_crud.get_course_tree(db, course_id, language)
+    # The course and its technology tree come back from one query
+    course = await course_crud.get_by_id_or_slug(db, id_or_slug, with_tree=True)
+    if not course:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Course with ID or slug '{id_or_slug}' not found"
+        )
+
+    # Get the course tree; it is always cached under the course ID
+    tree = course_crud.build_course_tree(course.id, course.technology_tree, language)
+    # orjson: дерево может быть большим, а эта же строка уходит и в кэш, и клиенту
+    serialized_tree = orjson.dumps(tree, default=str).decode()
+    await set_cached(
+        f"courses:tree:{course.id}:{language or '*'}",
+        serialized_tree,
+        expire=_COURSE_TREE_CACHE_TTL,
+        tag=course_cache_tag(course.id)
+    )
 
-    return tree
+    return _conditional_tree(request, response, serialized_tree)
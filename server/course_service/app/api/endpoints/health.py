@@ -1,9 +1,11 @@
 """
 API endpoints for health check
 """
+import asyncio
 from datetime import datetime, timezone
 
 from app.api.deps import get_db
+from app.cache import ping_cache
 from app.db.db import check_db_connection
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,11 +26,12 @@ async def health_check(db: AsyncSession = Depends(get_db)):
     Returns information about:
     - API status
     - Database connection status
+    - Cache (Redis) connection status
     """
     logger.info("Health check requested")
 
-    # Check database connection
-    db_status = await check_db_connection(db)
+    # Проверки независимы, поэтому выполняются параллельно: время ответа равно самой медленной из них
+    db_status, cache_status = await asyncio.gather(check_db_connection(db), ping_cache())
 
     return {
         "status": "healthy",
@@ -38,6 +41,9 @@ async def health_check(db: AsyncSession = Depends(get_db)):
         "database": {
             "status": "connected" if db_status else "disconnected"
         },
+        "cache": {
+            "status": "disabled" if cache_status is None else ("connected" if cache_status else "disconnected")
+        },
         "message": "Course service is healthy",
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
@@ -1,16 +1,38 @@
+import hashlib
+import json
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_db, get_current_user_id
+from app.cache import course_cache_tag, get_cached, invalidate_tag, set_cached
 from app.repositories.lesson import LessonRepository
-from app.repositories.article import ArticleRepository
 from app.repositories.course import CourseRepository
 from app.crud.technology_tree import technology_tree_crud
-from app.schemas.lesson import LessonResponse, LessonCreate, LessonUpdate, LessonListResponse, LessonWithContent
+from app.schemas.lesson import (
+    ArticleReference, LessonResponse, LessonCreate, LessonUpdate, LessonListResponse, LessonWithContent
+)
 
 router = APIRouter()
 
+# Уроки кэшируются под тегом курса: любое изменение урока или самого курса сбрасывает их вместе
+_LESSON_CACHE_TTL = 120
+
+
+def _lesson_list_key(course_id: UUID, params: dict) -> str:
+    """Build cache key for a page of the lesson list of a course."""
+    digest = hashlib.blake2b(
+        json.dumps(params, sort_keys=True, default=str).encode(),
+        digest_size=16
+    ).hexdigest()
+    return f"lessons:list:{course_id}:{digest}"
+
+
+def _json_response(payload: str) -> Response:
+    """Return already serialized JSON without validating it against response_model again."""
+    return Response(content=payload, media_type="application/json")
+
+
 @router.post("/", response_model=LessonResponse, status_code=status.HTTP_201_CREATED)
 async def create_lesson(
     lesson_data: LessonCreate,
@@ -46,15 +68,15 @@ async def create_lesson(
 
     # Validate node_id if provided
     if lesson_data.tree_node_id:
-        # Get the tree to check if node exists
-        tree = await technology_tree_crud.get_by_course_id(db, lesson_data.course_id)
-        if not tree or not tree.data or "nodes" not in tree.data or lesson_data.tree_node_id not in tree.data["nodes"]:
+        # Check the node in the database instead of loading the whole tree
+        if not await technology_tree_crud.node_exists_async(db, lesson_data.course_id, lesson_data.tree_node_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Node with ID {lesson_data.tree_node_id} not found in the course's technology tree"
             )
 
     lesson = await lesson_repo.create_lesson(lesson_data.course_id, lesson_data)
+    await invalidate_tag(course_cache_tag(lesson_data.course_id))
     return lesson
 
 @router.get("/", response_model=LessonListResponse)
@@ -76,6 +98,14 @@ async def list_lessons(
     - is_published: Filter by publication status
     - tree_node_id: Filter by associated technology tree node
     """
+    cache_key = _lesson_list_key(course_id, {
+        "skip": skip, "limit": limit, "language": language,
+        "is_published": is_published, "tree_node_id": tree_node_id
+    })
+    cached = await get_cached(cache_key)
+    if cached:
+        return _json_response(cached)
+
     lesson_repo = LessonRepository(db)
     lessons, total = await lesson_repo.get_lessons(
         course_id=course_id,
@@ -86,7 +116,9 @@ async def list_lessons(
         tree_node_id=tree_node_id
     )
 
-    return LessonListResponse(items=lessons, total=total)
+    payload = LessonListResponse(items=lessons, total=total).model_dump_json()
+    await set_cached(cache_key, payload, expire=_LESSON_CACHE_TTL, tag=course_cache_tag(course_id))
+    return _json_response(payload)
 
 @router.get("/{lesson_id}", response_model=LessonResponse)
 async def get_lesson(
@@ -97,6 +129,11 @@ async def get_lesson(
     """
     Get a specific lesson by ID.
     """
+    cache_key = f"lessons:id:{lesson_id}"
+    cached = await get_cached(cache_key)
+    if cached:
+        return _json_response(cached)
+
     lesson_repo = LessonRepository(db)
     lesson = await lesson_repo.get_lesson(lesson_id)
 
@@ -106,7 +143,9 @@ async def get_lesson(
             detail="Lesson not found"
         )
 
-    return lesson
+    payload = LessonResponse.model_validate(lesson).model_dump_json()
+    await set_cached(cache_key, payload, expire=_LESSON_CACHE_TTL, tag=course_cache_tag(lesson.course_id))
+    return _json_response(payload)
 
 @router.get("/{lesson_id}/content", response_model=LessonWithContent)
 async def get_lesson_with_content(
@@ -122,7 +161,6 @@ async def get_lesson_with_content(
     - language: Preferred language for content. If not specified, uses the lesson's language.
     """
     lesson_repo = LessonRepository(db)
-    article_repo = ArticleRepository(db)
 
     # Get the lesson
     lesson = await lesson_repo.get_lesson(lesson_id)
@@ -135,23 +173,29 @@ async def get_lesson_with_content(
     # Set language to lesson language if not specified
     content_language = language or lesson.language
 
-    # Get associated articles
-    articles = []
-    if lesson.article_ids:
-        for article_id in lesson.article_ids:
-            article = await article_repo.get_article(article_id)
-            if article and article.language == content_language:
-                articles.append(article)
+    # Статьи урока уже загружены вместе с ним (get_lesson грузит связь articles одним запросом),
+    # поэтому отдельный запрос на каждую статью не нужен; берем те, что переведены на нужный язык
+    articles = [
+        ArticleReference(
+            id=article.id,
+            title=article.title[content_language],
+            description=article.get_description(content_language),
+            language=content_language,
+            slug=article.slug
+        )
+        for article in lesson.articles
+        if article.title and content_language in article.title
+    ]
 
     # Get node information if lesson is associated with a tree node
     node_info = None
     if lesson.tree_node_id:
-        tree = await technology_tree_crud.get_by_course_id(db, lesson.course_id)
+        tree = await technology_tree_crud.get_by_course_id_async(db, lesson.course_id)
         if tree and tree.data and "nodes" in tree.data and lesson.tree_node_id in tree.data["nodes"]:
             node_info = tree.data["nodes"][lesson.tree_node_id]
 
     return LessonWithContent(
-        **lesson.__dict__,
+        **LessonResponse.model_validate(lesson).model_dump(),
         articles=articles,
         node_info=node_info
     )
@@ -180,14 +224,15 @@ async def update_lesson(
     if lesson_data.tree_node_id is not None:
         if lesson_data.tree_node_id:  # If not None or empty string
             # Check if node exists in tree
-            tree = await technology_tree_crud.get_by_course_id(db, lesson.course_id)
-            if not tree or not tree.data or "nodes" not in tree.data or lesson_data.tree_node_id not in tree.data["nodes"]:
+            if not await technology_tree_crud.node_exists_async(db, lesson.course_id, lesson_data.tree_node_id):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Node with ID {lesson_data.tree_node_id} not found in the course's technology tree"
                 )
 
+    course_id = lesson.course_id
     updated_lesson = await lesson_repo.update_lesson(lesson_id, lesson_data)
+    await invalidate_tag(course_cache_tag(course_id))
     return updated_lesson
 
 @router.delete("/{lesson_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -201,20 +246,14 @@ async def delete_lesson(
     """
     lesson_repo = LessonRepository(db)
 
-    # Verify lesson exists
-    lesson = await lesson_repo.get_lesson(lesson_id)
-    if not lesson:
+    # DELETE ... RETURNING: отсутствие урока видно по пустому результату, без предварительного SELECT
+    course_id = await lesson_repo.delete_lesson(lesson_id)
+    if course_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Lesson not found"
         )
-
-    success = await lesson_repo.delete_lesson(lesson_id)
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete lesson"
-        )
+    await invalidate_tag(course_cache_tag(course_id))
 
 @router.post("/{lesson_id}/articles/{article_id}", status_code=status.HTTP_200_OK)
 async def add_article_to_lesson(
@@ -227,31 +266,15 @@ async def add_article_to_lesson(
     Associate an article with a lesson.
     """
     lesson_repo = LessonRepository(db)
-    article_repo = ArticleRepository(db)
 
-    # Verify lesson exists
-    lesson = await lesson_repo.get_lesson(lesson_id)
-    if not lesson:
+    # Add article to lesson (the lesson, the article and their common course are checked in one query)
+    course_id = await lesson_repo.add_article_to_lesson(lesson_id, article_id)
+    if course_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Lesson not found"
-        )
-
-    # Verify article exists and belongs to the same course as lesson
-    article = await article_repo.get_article(article_id)
-    if not article or article.course_id != lesson.course_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Article not found or does not belong to the same course as the lesson"
-        )
-
-    # Add article to lesson
-    success = await lesson_repo.add_article_to_lesson(lesson_id, article_id)
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to add article to lesson"
+            detail="Lesson or article not found, or the article does not belong to the same course as the lesson"
         )
+    await invalidate_tag(course_cache_tag(course_id))
 
     return {"message": "Article added to lesson successfully"}
 
@@ -267,20 +290,13 @@ async def remove_article_from_lesson(
     """
     lesson_repo = LessonRepository(db)
 
-    # Verify lesson exists
-    lesson = await lesson_repo.get_lesson(lesson_id)
-    if not lesson:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Lesson not found"
-        )
-
     # Remove article from lesson
-    success = await lesson_repo.remove_article_from_lesson(lesson_id, article_id)
-    if not success:
+    course_id = await lesson_repo.remove_article_from_lesson(lesson_id, article_id)
+    if course_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Article not found in lesson"
         )
+    await invalidate_tag(course_cache_tag(course_id))
 
     return {"message": "Article removed from lesson successfully"}
@@ -214,6 +214,26 @@ async def invalidate_cache(key_pattern: str) -> int:
         return 0
 
 
+async def delete_cached(key: str) -> int:
+    """
+    Delete a single cache key
+
+    Args:
+        key: Exact cache key
+
+    Returns:
+        Number of keys deleted
+    """
+    if not settings.REDIS_ENABLED or not _redis_client:
+        return 0
+
+    try:
+        return await _redis_client.delete(key)
+    except Exception as e:
+        logger.error(f"Error invalidating cache: {str(e)}")
+        return 0
+
+
 async def clear_all_cache() -> bool:
     """
     Clear entire cache
@@ -231,3 +251,109 @@ async def clear_all_cache() -> bool:
     except Exception as e:
         logger.error(f"Error clearing cache: {str(e)}")
         return False
+
+
+async def ping_cache() -> Optional[bool]:
+    """
+    Check Redis connection
+
+    Returns:
+        True if Redis answers, False on error, None when cache is disabled
+    """
+    if not settings.REDIS_ENABLED or not _redis_client:
+        return None
+
+    try:
+        return bool(await _redis_client.ping())
+    except Exception as e:
+        logger.error(f"Cache ping failed: {str(e)}")
+        return False
+
+
+def course_cache_tag(course_id: Any) -> str:
+    """
+    Get name of the tag set that tracks all cached entries of a course
+
+    Args:
+        course_id: Course ID
+
+    Returns:
+        Tag set name
+    """
+    return f"courses:keys:{course_id}"
+
+
+async def get_cached(key: str) -> Optional[str]:
+    """
+    Get a raw cached value
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Cached string or None on miss, when cache is disabled or on Redis error
+    """
+    if not settings.REDIS_ENABLED or not _redis_client:
+        return None
+
+    try:
+        cached_data = await _redis_client.get(key)
+        if cached_data is None:
+            logger.debug(f"Cache miss for key: {key}")
+            return None
+        logger.debug(f"Cache hit for key: {key}")
+        return cached_data.decode() if isinstance(cached_data, bytes) else cached_data
+    except Exception as e:
+        logger.error(f"Cache error: {str(e)}")
+        return None
+
+
+async def set_cached(key: str, value: str, expire: int = None, tag: str = None) -> None:
+    """
+    Store a raw value in cache, optionally registering the key under a tag set
+
+    Tagged keys are removed together by invalidate_tag without scanning the keyspace.
+
+    Args:
+        key: Cache key
+        value: Serialized value
+        expire: Expiration time in seconds (default: from settings)
+        tag: Name of the Redis set that tracks this key
+    """
+    if not settings.REDIS_ENABLED or not _redis_client:
+        return
+
+    expiration = expire or settings.CACHE_EXPIRE_IN_SECONDS
+    try:
+        pipe = _redis_client.pipeline()
+        pipe.setex(key, expiration, value)
+        if tag:
+            pipe.sadd(tag, key)
+            # Набор тега должен жить не меньше своих ключей, иначе invalidate_tag их не найдет
+            pipe.expire(tag, max(expiration, settings.CACHE_EXPIRE_IN_SECONDS))
+        await pipe.execute()
+    except Exception as e:
+        logger.error(f"Cache error: {str(e)}")
+
+
+async def invalidate_tag(*tags: str) -> int:
+    """
+    Invalidate all cache keys registered under the given tag sets
+
+    Args:
+        tags: Names of tag sets
+
+    Returns:
+        Number of keys deleted (including the tag sets themselves)
+    """
+    if not settings.REDIS_ENABLED or not _redis_client or not tags:
+        return 0
+
+    try:
+        keys = await _redis_client.sunion(*tags)
+        deleted = await _redis_client.delete(*keys, *tags)
+        logger.debug(f"Invalidated {deleted} cache keys for tags: {', '.join(tags)}")
+        return deleted
+    except Exception as e:
+        logger.error(f"Error invalidating cache: {str(e)}")
+        return 0
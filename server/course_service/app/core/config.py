@@ -24,6 +24,17 @@ class Settings(BaseServiceSettings):
     # Настройки логирования SQL
     DB_ECHO: bool = os.getenv("DB_ECHO", "false").lower() == "true"
 
+    # Настройки пула соединений асинхронного engine
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Seconds
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))  # Seconds to wait for a free connection
+    # За PgBouncer пулом управляет он сам, локальный пул SQLAlchemy отключается (NullPool)
+    DB_USE_NULL_POOL: bool = os.getenv("DB_USE_NULL_POOL", "false").lower() == "true"
+
+    # Создание таблиц через create_all при старте (можно отключить, если схема уже развернута)
+    AUTO_CREATE_TABLES: bool = os.getenv("AUTO_CREATE_TABLES", "true").lower() == "true"
+
     # Настройки аутентификации
     AUTH_SECRET_KEY: str = os.getenv("AUTH_SECRET_KEY", "your-secret-key-for-jwt-tokens-must-be-set-in-production")
 
@@ -37,7 +48,7 @@ class Settings(BaseServiceSettings):
     ASYNC_DB_DRIVER: str = os.getenv("ASYNC_DB_DRIVER", "postgresql+asyncpg")
 
     # Redis для кеширования
-    REDIS_ENABLED: bool = False  # Redis currently disabled
+    REDIS_ENABLED: bool = os.getenv("REDIS_ENABLED", "false").lower() == "true"
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
     REDIS_PASSWORD: str = os.getenv("REDIS_PASSWORD", "")
@@ -1,6 +1,8 @@
 """
 CRUD operations for Course model
 """
+import logging
+import re
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union, Tuple
@@ -10,10 +12,12 @@ from app.models.article import Article
 from app.models.course import Course, generate_slug, course_tag, CourseVisibility
 from app.models.tag import Tag
 from app.crud.technology_tree import technology_tree_crud
-from app.schemas.course import CourseCreate, CourseUpdate, CourseSearchParams
+from app.schemas.course import CourseCreate, CourseUpdate, CourseSearchParams, CourseVisibilityUpdate
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy import desc, asc, or_, text
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, desc, asc, or_, text, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.sql import func
 from sqlalchemy.sql import select
 
@@ -22,11 +26,48 @@ from common.logger import get_logger
 # Создаем логгер для этого модуля
 logger = get_logger("course_service.crud.course")
 
+# Колонки курса, которые можно менять через update_metadata
+_METADATA_COLUMNS = frozenset(c.key for c in Course.__table__.columns) - {"id", "search_vector"}
+_EMPTY_JSONB = sa.cast({}, JSONB)
+
+# Канонический вид UUID; отличает ID от slug без исключений в горячем пути
+_UUID_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.I)
+
+# Максимальное число ID в одном DELETE ... WHERE id IN (...), чтобы не упираться в лимит параметров
+_BULK_DELETE_CHUNK_SIZE = 900
+
+
+def _prefix_tsquery(search: str) -> Optional[str]:
+    """
+    Build a to_tsquery expression matching every word of the search term as a prefix
+
+    Args:
+        search: Free-text search term
+
+    Returns:
+        tsquery text like 'prog:* & intro:*', or None if the term has no words
+    """
+    words = re.findall(r"\w+", search.lower())
+    return " & ".join(f"{word}:*" for word in words) or None
+
+
+def parse_course_id(id_or_slug: str) -> Optional[uuid.UUID]:
+    """
+    Parse a course identifier that may be either a UUID or a slug
+
+    Args:
+        id_or_slug: Course UUID or slug
+
+    Returns:
+        UUID if the value is a canonical UUID, None if it is a slug
+    """
+    return uuid.UUID(id_or_slug) if _UUID_RE.fullmatch(id_or_slug) else None
+
 
 class CRUDCourse:
     """CRUD operations for Course model"""
 
-    async def get(self, db: Session, id: uuid.UUID) -> Optional[Course]:
+    async def get(self, db: AsyncSession, id: uuid.UUID) -> Optional[Course]:
         """
         Get a course by ID with related tags
 
@@ -43,7 +84,7 @@ class CRUDCourse:
         result = await db.execute(stmt)
         return result.unique().scalar_one_or_none()
 
-    async def get_course(self, db: Session, course_id: uuid.UUID) -> Optional[Course]:
+    async def get_course(self, db: AsyncSession, course_id: uuid.UUID) -> Optional[Course]:
         """
         Get a course by ID with related technology tree
 
@@ -56,7 +97,83 @@ class CRUDCourse:
         """
         return await self.get(db, course_id)
 
-    async def get_by_slug(self, db: Session, slug: str) -> Optional[Course]:
+    async def exists(self, db: AsyncSession, course_id: uuid.UUID) -> bool:
+        """
+        Check if a course exists without loading it
+
+        Args:
+            db: Database session
+            course_id: UUID of the course
+
+        Returns:
+            True if course exists, False otherwise
+        """
+        result = await db.execute(select(sa.exists().where(Course.id == course_id)))
+        return bool(result.scalar())
+
+    async def get_by_id_or_slug(
+            self,
+            db: AsyncSession,
+            id_or_slug: str,
+            *,
+            with_tree: bool = False
+    ) -> Optional[Course]:
+        """
+        Get a course by ID or slug with a single query
+
+        A value that parses as UUID is matched against both columns, the ID taking precedence.
+
+        Args:
+            db: Database session
+            id_or_slug: Course UUID or slug
+            with_tree: Load the technology tree instead of the tags
+
+        Returns:
+            Course object or None if not found
+        """
+        stmt = select(Course).options(
+            joinedload(Course.technology_tree) if with_tree else joinedload(Course.tags)
+        )
+        course_id = parse_course_id(id_or_slug)
+        if course_id is None:
+            stmt = stmt.where(Course.slug == id_or_slug)
+        else:
+            stmt = stmt.where(or_(Course.id == course_id, Course.slug == id_or_slug)).order_by(
+                desc(Course.id == course_id)
+            )
+        result = await db.execute(stmt)
+        return result.unique().scalars().first()
+
+    async def get_languages(
+            self,
+            db: AsyncSession,
+            course_id: uuid.UUID
+    ) -> Optional[Tuple[List[str], datetime]]:
+        """
+        Get the languages of a course without loading the course
+
+        The language codes are collected in the database from the keys of the
+        title and description fields, like Course.available_languages().
+
+        Args:
+            db: Database session
+            course_id: UUID of the course
+
+        Returns:
+            Tuple of (sorted language codes, course updated_at), or None if course not found
+        """
+        merged = func.coalesce(Course.title, _EMPTY_JSONB).op("||")(func.coalesce(Course.description, _EMPTY_JSONB))
+        keys = func.jsonb_object_keys(merged).table_valued("key")
+        stmt = select(
+            select(func.array_agg(keys.c.key)).scalar_subquery().label("languages"),
+            Course.updated_at
+        ).where(Course.id == course_id)
+        row = (await db.execute(stmt)).first()
+        if row is None:
+            return None
+        return sorted(row.languages or []), row.updated_at
+
+    async def get_by_slug(self, db: AsyncSession, slug: str) -> Optional[Course]:
         """
         Get course by slug with related tags
 
@@ -77,7 +194,7 @@ class CRUDCourse:
         result = await db.execute(stmt)
         return result.unique().scalar_one_or_none()
 
-    async def get_by_title(self, db: Session, title: str, language: str = 'en') -> Optional[Course]:
+    async def get_by_title(self, db: AsyncSession, title: str, language: str = 'en') -> Optional[Course]:
         """
         Get course by title with related tags
 
@@ -101,7 +218,7 @@ class CRUDCourse:
         return result.unique().scalar_one_or_none()
 
     async def get_multi(
-            self, db: Session, *, skip: int = 0, limit: int = 100
+            self, db: AsyncSession, *, skip: int = 0, limit: int = 100
     ) -> List[Course]:
         """
         Get multiple courses with pagination and related tags
@@ -117,7 +234,7 @@ class CRUDCourse:
         logger.info(f"Getting all courses with skip={skip}, limit={limit}")
         try:
             stmt = select(Course).options(
-                joinedload(Course.tags)
+                selectinload(Course.tags)
             ).offset(skip).limit(limit).order_by(desc(Course.created_at))
 
             result = await db.execute(stmt)
@@ -130,11 +247,13 @@ class CRUDCourse:
 
     async def search_courses(
             self,
-            db: Session,
+            db: AsyncSession,
             params: CourseSearchParams,
             skip: int = 0,
-            limit: int = 10
-    ) -> Tuple[List[Course], int]:
+            limit: int = 10,
+            after: Optional[Tuple[datetime, uuid.UUID]] = None,
+            compute_total: bool = True
+    ) -> Tuple[List[Course], Optional[int]]:
         """
         Search and filter courses with advanced parameters
 
@@ -143,34 +262,36 @@ class CRUDCourse:
             params: Search parameters object
             skip: Number of records to skip (offset)
             limit: Maximum number of records to return
+            after: Keyset cursor (created_at, id) of the last course of the previous page;
+                only valid when sorting by created_at
+            compute_total: Whether to count all matching courses; the window count makes
+                Postgres visit every matching row, so callers that only page skip it
 
         Returns:
-            Tuple of (list of courses, total count)
+            Tuple of (list of courses, total count). With a cursor the total counts
+            the matching courses from the cursor position onwards; the total is None
+            when compute_total is False
+
+        Raises:
+            ValueError: If a cursor is given for a sort field other than created_at
         """
-        # Построим базовый запрос
-        stmt = select(Course).options(
-            joinedload(Course.tags)
-        )
+        # Построим базовый запрос; теги списка грузятся одним отдельным запросом (selectin),
+        # чтобы не размножать строки курсов JOIN'ом и не оборачивать LIMIT в подзапрос.
+        # Оконный count возвращает общее число найденных курсов в каждой строке страницы
+        columns = [Course, func.count().over().label("total")] if compute_total else [Course]
+        stmt = select(*columns).options(selectinload(Course.tags))
 
         # Логируем параметры поиска
-        logger.info(f"Searching courses with params: {params}")
+        logger.debug("Searching courses with params: %s", params)
 
-        # Apply search filter if provided
+        # Apply search filter if provided: full-text match on the generated search_vector column
+        # (GIN index); each word matches as a prefix, in any language of the title or description
         if params.search:
-            # Search in title and description for the specified language
-            lang = params.language or 'en'
-
-            # Using PostgreSQL specific JSON operators to search in the fields
-            title_filter = text(f"title->'{lang}' ILIKE :search")
-            desc_filter = text(f"description->'{lang}' ILIKE :search")
-
-            search_term = f'%{params.search}%'
-            stmt = stmt.where(
-                or_(
-                    title_filter,
-                    desc_filter
-                )
-            ).params(search=search_term)
+            tsquery = _prefix_tsquery(params.search)
+            if tsquery is None:
+                stmt = stmt.where(sa.false())
+            else:
+                stmt = stmt.where(Course.search_vector.op('@@')(func.to_tsquery('simple', tsquery)))
 
         # Filter by author if provided
         if params.author_id:
@@ -198,18 +319,21 @@ class CRUDCourse:
         # Filter by tags if provided
         if params.tags and len(params.tags) > 0:
             # Get courses that have any of the specified tags
+            # (EXISTS instead of JOIN + DISTINCT, so the window count sees each course once)
             tag_ids = [uuid.UUID(tag_id) for tag_id in params.tags]
-            stmt = stmt.join(Course.tags).where(Tag.id.in_(tag_ids)).distinct()
-
-        # Логируем запрос
-        logger.info(f"SQL query: {stmt}")
+            stmt = stmt.where(Course.tags.any(Tag.id.in_(tag_ids)))
 
-        # Get total count before applying pagination
-        count_stmt = select(sa.func.count()).select_from(stmt.subquery())
-        total_result = await db.execute(count_stmt)
-        total = total_result.scalar_one()
+        # Логируем запрос (компиляция SQL в строку дорогая, поэтому только при включенном DEBUG)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SQL query: %s", stmt)
 
-        logger.info(f"Total found: {total}")
+        # Keyset pagination: continue strictly after the (created_at, id) of the previous page,
+        # so deep pages use the index instead of scanning and discarding OFFSET rows
+        if after is not None:
+            if params.sort_by not in (None, 'created_at'):
+                raise ValueError("cursor pagination is only supported when sorting by created_at")
+            keyset = sa.tuple_(Course.created_at, Course.id)
+            stmt = stmt.where(keyset > sa.tuple_(*after) if params.sort_order == 'asc' else keyset < sa.tuple_(*after))
 
         # Apply sorting
         if params.sort_by:
@@ -242,19 +366,32 @@ class CRUDCourse:
             # Default sort
             stmt = stmt.order_by(desc(Course.created_at))
 
-        # Apply pagination
-        stmt = stmt.offset(skip).limit(limit)
-        results = await db.execute(stmt)
+        # id breaks ties, so the order is stable across pages (required by the keyset cursor)
+        stmt = stmt.order_by(asc(Course.id) if params.sort_order == 'asc' else desc(Course.id))
 
-        # Добавляем unique() для результатов, содержащих eager-загруженные коллекции
-        courses = results.unique().scalars().all()
+        # Apply pagination
+        results = await db.execute(stmt.offset(skip).limit(limit))
+        rows = results.all()
+        courses = [row[0] for row in rows]
+
+        if not compute_total:
+            total = None
+        elif rows:
+            total = rows[0].total
+        elif skip == 0:
+            total = 0
+        else:
+            # An empty page carries no window count; a page past the end still needs the real total
+            count_stmt = select(sa.func.count()).select_from(stmt.with_only_columns(Course.id).subquery())
+            total_result = await db.execute(count_stmt)
+            total = total_result.scalar_one()
 
         # Логируем количество найденных курсов
-        logger.info(f"Found {len(courses)} courses after applying pagination")
+        logger.debug("Total found: %s, %s courses after applying pagination", total, len(courses))
 
         return courses, total
 
-    async def create(self, db: Session, *, obj_in: CourseCreate) -> Course:
+    async def create(self, db: AsyncSession, *, obj_in: CourseCreate) -> Course:
         """
         Create a new course
 
@@ -310,7 +447,7 @@ class CRUDCourse:
         # Загружаем полноценный объект со всеми связанными данными для возврата
         return await self.get(db, db_obj.id)
 
-    async def update(self, db: Session, *, db_obj: Course, obj_in: Union[CourseUpdate, Dict[str, Any]]) -> Course:
+    async def update(self, db: AsyncSession, *, db_obj: Course, obj_in: Union[CourseUpdate, Dict[str, Any]]) -> Course:
         """
         Update a course
 
@@ -368,7 +505,7 @@ class CRUDCourse:
         await db.refresh(db_obj)
         return db_obj
 
-    async def remove(self, db: Session, *, id: uuid.UUID) -> Course:
+    async def remove(self, db: AsyncSession, *, id: uuid.UUID) -> Course:
         """
         Remove a course
 
@@ -387,7 +524,7 @@ class CRUDCourse:
             await db.commit()
         return obj
 
-    async def _get_or_create_tag(self, db: Session, tag_name: str) -> Tag:
+    async def _get_or_create_tag(self, db: AsyncSession, tag_name: str) -> Tag:
         """
         Get existing tag by name or create a new one
 
@@ -413,7 +550,7 @@ class CRUDCourse:
         await db.refresh(tag)
         return tag
 
-    async def get_courses(self, db: Session, skip: int = 0, limit: int = 100, order_by: str = "created_at",
+    async def get_courses(self, db: AsyncSession, skip: int = 0, limit: int = 100, order_by: str = "created_at",
                           order_desc: bool = True) -> List[Course]:
         """
         Get courses with sorting, pagination and related technology trees
@@ -429,7 +566,7 @@ class CRUDCourse:
             List of courses
         """
         stmt = select(Course).options(
-            joinedload(Course.tags)
+            selectinload(Course.tags)
         )
 
         # Handle ordering
@@ -450,7 +587,7 @@ class CRUDCourse:
         result = await db.execute(stmt)
         return result.unique().scalars().all()
 
-    async def search_courses_by_tag(self, db: Session, tag: str, skip: int = 0, limit: int = 100) -> List[Course]:
+    async def search_courses_by_tag(self, db: AsyncSession, tag: str, skip: int = 0, limit: int = 100) -> List[Course]:
         """
         Search courses by tag name with related technology trees
 
@@ -477,7 +614,7 @@ class CRUDCourse:
             .join(course_tag)
             .where(course_tag.c.tag_id == tag_obj.id)
             .options(
-                joinedload(Course.tags)
+                selectinload(Course.tags)
             )
             .offset(skip)
             .limit(limit)
@@ -486,7 +623,7 @@ class CRUDCourse:
         result = await db.execute(stmt)
         return result.unique().scalars().all()
 
-    async def update_course(self, db: Session, course_id: uuid.UUID, course_in: CourseUpdate) -> Optional[Course]:
+    async def update_course(self, db: AsyncSession, course_id: uuid.UUID, course_in: CourseUpdate) -> Optional[Course]:
         """
         Update a course by ID
 
@@ -503,7 +640,7 @@ class CRUDCourse:
             return None
         return await self.update(db, db_obj=db_obj, obj_in=course_in)
 
-    async def delete_course(self, db: Session, course_id: uuid.UUID) -> bool:
+    async def delete_course(self, db: AsyncSession, course_id: uuid.UUID) -> bool:
         """
         Delete a course by ID
 
@@ -514,13 +651,65 @@ class CRUDCourse:
         Returns:
             True if successful, False if course not found
         """
-        obj = await self.get(db, course_id)
-        if not obj:
-            return False
-        await self.remove(db, id=course_id)
-        return True
+        return bool(await self.bulk_delete(db, [course_id]))
 
-    async def update_metadata(self, db: Session, course_id: uuid.UUID, metadata: Dict[str, Any]) -> Optional[Course]:
+    async def bulk_delete(self, db: AsyncSession, course_ids: List[uuid.UUID]) -> List[uuid.UUID]:
+        """
+        Delete several courses with batched DELETE statements in one transaction
+
+        Articles, lessons and technology trees are removed by ON DELETE CASCADE in the database,
+        tag links are removed explicitly because course_tag has no cascade.
+
+        Args:
+            db: Database session
+            course_ids: UUIDs of the courses to delete
+
+        Returns:
+            UUIDs of the courses that were actually deleted
+        """
+        deleted: List[uuid.UUID] = []
+        unique_ids = list(dict.fromkeys(course_ids))
+        for start in range(0, len(unique_ids), _BULK_DELETE_CHUNK_SIZE):
+            chunk = unique_ids[start:start + _BULK_DELETE_CHUNK_SIZE]
+            await db.execute(delete(course_tag).where(course_tag.c.course_id.in_(chunk)))
+            result = await db.execute(
+                delete(Course).where(Course.id.in_(chunk)).returning(Course.id)
+            )
+            deleted.extend(result.scalars().all())
+        await db.commit()
+        return deleted
+
+    async def _update_returning(self, db: AsyncSession, course_id: uuid.UUID, values: Dict[str, Any],
+                                *criteria: Any) -> Optional[Course]:
+        """
+        Update a course with a single UPDATE ... RETURNING statement
+
+        Args:
+            db: Database session
+            course_id: UUID of the course
+            values: Column values or SQL expressions to set
+            criteria: Additional WHERE conditions
+
+        Returns:
+            Updated Course object with tags loaded, or None if no row matched
+        """
+        stmt = (
+            select(Course)
+            .from_statement(
+                update(Course)
+                .where(Course.id == course_id, *criteria)
+                .values(**values)
+                .returning(Course)
+            )
+            .options(selectinload(Course.tags))
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        course = result.scalars().first()
+        await db.commit()
+        return course
+
+    async def update_metadata(self, db: AsyncSession, course_id: uuid.UUID, metadata: Dict[str, Any]) -> Optional[Course]:
         """
         Update specific metadata fields for a course
 
@@ -532,29 +721,40 @@ class CRUDCourse:
         Returns:
             Updated Course object, or None if course not found
         """
-        # Get the course
-        course = await self.get(db, course_id)
-        if not course:
-            return None
+        # Update only the known columns
+        values = {field: value for field, value in metadata.items() if field in _METADATA_COLUMNS}
+        values["updated_at"] = datetime.now(timezone.utc)
 
-        # Update only the specified fields
-        for field, value in metadata.items():
-            if hasattr(course, field):
-                setattr(course, field, value)
+        return await self._update_returning(db, course_id, values)
 
-        # Update timestamp
-        course.updated_at = datetime.now(timezone.utc)
+    async def update_visibility(
+            self,
+            db: AsyncSession,
+            course_id: uuid.UUID,
+            visibility_in: CourseVisibilityUpdate
+    ) -> Optional[Course]:
+        """
+        Change visibility of a course with a single UPDATE ... RETURNING
 
-        # Save changes
-        db.add(course)
-        await db.commit()
-        await db.refresh(course)
+        CourseVisibilityUpdate has already cleared organization_id for levels other than ORGANIZATION.
 
-        return course
+        Args:
+            db: Database session
+            course_id: UUID of the course
+            visibility_in: Validated visibility data
+
+        Returns:
+            Updated Course object, or None if course not found
+        """
+        return await self._update_returning(db, course_id, {
+            "visibility": visibility_in.visibility,
+            "organization_id": visibility_in.organization_id,
+            "updated_at": datetime.now(timezone.utc)
+        })
 
     async def update_course_language(
             self,
-            db: Session,
+            db: AsyncSession,
             course_id: uuid.UUID,
             language: str,
             title: str,
@@ -573,38 +773,23 @@ class CRUDCourse:
         Returns:
             Updated Course object, or None if course not found
         """
-        # Get the course
-        course = await self.get(db, course_id)
-        if not course:
-            return None
-
-        # Add or update the language version
-        if not isinstance(course.title, dict):
-            course.title = {}
-
-        if course.description is None:
-            course.description = {}
-        elif not isinstance(course.description, dict):
-            course.description = {}
-
-        # Update the title
-        course.title[language] = title
-
-        # Update the description if provided
+        # Языковая версия добавляется в JSONB на стороне базы (||), остальные языки не затрагиваются
+        values = {
+            "title": func.coalesce(Course.title, _EMPTY_JSONB).op("||")(
+                func.jsonb_build_object(language, title)
+            ),
+            "updated_at": datetime.now(timezone.utc)
+        }
         if description is not None:
-            course.description[language] = description
-
-        # Save changes
-        course.updated_at = datetime.now(timezone.utc)
-        db.add(course)
-        await db.commit()
-        await db.refresh(course)
+            values["description"] = func.coalesce(Course.description, _EMPTY_JSONB).op("||")(
+                func.jsonb_build_object(language, description)
+            )
 
-        return course
+        return await self._update_returning(db, course_id, values)
 
     async def remove_course_language(
             self,
-            db: Session,
+            db: AsyncSession,
             course_id: uuid.UUID,
             language: str
     ) -> Optional[Course]:
@@ -619,23 +804,21 @@ class CRUDCourse:
         Returns:
             Updated course if found and language was removed, None otherwise
         """
-        course = await self.get_course(db, course_id)
-        if not course:
-            return None
-
-        # Remove the language
-        course.remove_language(language)
-
-        # Update the database
-        db.add(course)
-        await db.commit()
-        await db.refresh(course)
-
-        return course
+        # The row is matched only if it has the language, so "not found" covers both cases
+        return await self._update_returning(
+            db,
+            course_id,
+            {
+                "title": Course.title.op("-")(language),
+                "description": Course.description.op("-")(language),
+                "updated_at": datetime.now(timezone.utc)
+            },
+            or_(Course.title.has_key(language), Course.description.has_key(language))
+        )
 
     async def get_course_tree(
             self,
-            db: Session,
+            db: AsyncSession,
             course_id: uuid.UUID,
             language: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -657,7 +840,25 @@ class CRUDCourse:
 
         # Get technology tree directly using technology_tree_crud
         technology_tree = await technology_tree_crud.get_by_course_id_async(db, course_id)
-        
+        return self.build_course_tree(course_id, technology_tree, language)
+
+    def build_course_tree(
+            self,
+            course_id: uuid.UUID,
+            technology_tree: Optional[Any],
+            language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the tree structure of a course from its already loaded technology tree
+
+        Args:
+            course_id: UUID of the course
+            technology_tree: Technology tree of the course or None
+            language: Optional language code for localized content
+
+        Returns:
+            Dictionary with the course tree structure
+        """
         # If the course has a technology tree, return it
         if technology_tree:
             tree_data = technology_tree.data
@@ -681,7 +882,7 @@ class CRUDCourse:
             "tree": {}
         }
 
-    async def get_by_id(self, db: Session, course_id: int) -> Optional[Course]:
+    async def get_by_id(self, db: AsyncSession, course_id: int) -> Optional[Course]:
         """
         Get a course by ID
 
@@ -8,9 +8,11 @@ from uuid import UUID
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import cast, select
+from sqlalchemy.dialects.postgresql import JSONB
 
 from common.logger import get_logger
+from ..cache import course_cache_tag, invalidate_tag
 from ..models.course import Course
 from ..models.technology_tree import TechnologyTree
 from ..schemas.technology_tree import TechnologyTreeCreate, TechnologyTreeUpdate
@@ -76,6 +78,29 @@ class TechnologyTreeCRUD:
         result = await db.execute(select(TechnologyTree).filter(TechnologyTree.course_id == course_id))
         return result.scalar_one_or_none()
 
+    async def node_exists_async(self, db: AsyncSession, course_id: UUID, node_id: str) -> bool:
+        """
+        Check that a node exists in the technology tree of a course
+
+        The check runs in the database (jsonb key existence), so the tree JSON is not
+        transferred and parsed just to look up one key.
+
+        Args:
+            db: Async database session
+            course_id: UUID of the course
+            node_id: ID of the node
+
+        Returns:
+            True if the course has a tree containing the node, False otherwise
+        """
+        nodes = cast(TechnologyTree.data, JSONB)["nodes"]
+        result = await db.execute(
+            select(TechnologyTree.id)
+            .where(TechnologyTree.course_id == course_id, nodes.has_key(str(node_id)))
+            .limit(1)
+        )
+        return result.first() is not None
+
     def create(self, db: Session, obj_in: TechnologyTreeCreate) -> TechnologyTree:
         """
         Create a new technology tree
@@ -170,6 +195,7 @@ class TechnologyTreeCRUD:
             db.add(db_obj)
             await db.commit()
             await db.refresh(db_obj)
+            await invalidate_tag(course_cache_tag(db_obj.course_id))
             logger.info(f"Created technology tree for course {obj_in.course_id}")
             return db_obj
 
@@ -506,6 +532,7 @@ class TechnologyTreeCRUD:
             db.add(db_obj)
             await db.commit()
             await db.refresh(db_obj)
+            await invalidate_tag(course_cache_tag(db_obj.course_id))
             logger.info(f"Updated technology tree {db_obj.id}")
             return db_obj
 
@@ -539,6 +566,7 @@ class TechnologyTreeCRUD:
 
             await db.delete(db_obj)
             await db.commit()
+            await invalidate_tag(course_cache_tag(db_obj.course_id))
             logger.info(f"Deleted technology tree {id}")
             return True
 
@@ -581,6 +609,7 @@ class TechnologyTreeCRUD:
             db.add(db_obj)
             await db.commit()
             await db.refresh(db_obj)
+            await invalidate_tag(course_cache_tag(db_obj.course_id))
             logger.info(f"Updated technology tree data for tree {tree_id}")
             return db_obj
 
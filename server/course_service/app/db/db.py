@@ -14,6 +14,7 @@ from sqlalchemy import text, inspect, create_engine
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from common.logger import get_logger
 from ..core.config import settings
@@ -25,12 +26,24 @@ logger = get_logger("course_service.db")
 # Используем асинхронный URL из настроек
 logger.info(f"Используем асинхронный URL для подключения к БД: {settings.ASYNC_SQLALCHEMY_DATABASE_URI}")
 
+# Параметры пула: за PgBouncer соединения не держим у себя, иначе пул с таймаутом ожидания
+# и переподключением устаревших соединений (pre_ping, recycle)
+if settings.DB_USE_NULL_POOL:
+    _pool_options = {"poolclass": NullPool}
+else:
+    _pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
 # Async engine and session factory
 engine = create_async_engine(
     settings.ASYNC_SQLALCHEMY_DATABASE_URI,
     echo=settings.DB_ECHO,
     pool_pre_ping=True,
-    pool_recycle=3600,
+    **_pool_options,
 )
 
 async_session_factory = async_sessionmaker(
@@ -58,9 +71,10 @@ async def init_db():
         async with engine.begin() as conn:
             await conn.execute(text("SELECT 1"))
 
-        # Create tables
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        # Create tables; skipped when the schema is managed outside the service
+        if settings.AUTO_CREATE_TABLES:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
 
         return True
     except Exception as e:
@@ -105,20 +119,9 @@ class AsyncDatabaseManager:
         safe_async_uri = settings.ASYNC_SQLALCHEMY_DATABASE_URI.replace(settings.POSTGRES_PASSWORD, "****")
         self.logger.info(f"Async Database URI: {safe_async_uri}")
 
-        # Создаем асинхронный engine
-        try:
-            # Используем асинхронный URL из настроек
-            self.async_engine = create_async_engine(
-                settings.ASYNC_SQLALCHEMY_DATABASE_URI,
-                pool_pre_ping=True,
-                echo=settings.DB_ECHO
-            )
-            self.logger.info("AsyncIO SQLAlchemy engine created successfully")
-        except Exception as e:
-            self.logger.error(f"Error creating async SQLAlchemy engine: {str(e)}")
-            self.logger.error(f"Engine traceback: {traceback.format_exc()}")
-            # Re-raise to prevent initialization with a broken engine
-            raise
+        # Используем общий асинхронный engine модуля: второй engine открывал бы отдельный пул
+        # с настройками по умолчанию, и сессии запросов обходили бы настроенный пул
+        self.async_engine = engine
 
         # Создаем синхронный engine для случаев, когда нужен синхронный доступ
         try:
@@ -218,7 +221,7 @@ class AsyncDatabaseManager:
 
         Эта функция:
         1. Проверяет подключение к базе данных
-        2. Создает все таблицы
+        2. Создает все таблицы (если включен AUTO_CREATE_TABLES)
         3. Загружает начальные данные, если они предоставлены
 
         Returns:
@@ -236,6 +239,11 @@ class AsyncDatabaseManager:
                 self.logger.error("Database connection test failed")
                 return False
 
+            # Схема развернута вне сервиса: никаких DDL (ни сброса схемы, ни create_all)
+            if not self.settings.AUTO_CREATE_TABLES:
+                self.logger.info("AUTO_CREATE_TABLES is disabled, skipping table creation")
+                return True
+
             # Импортируем модели и создаем таблицы
             self.logger.info("Preparing to create tables...")
 
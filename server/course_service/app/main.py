@@ -48,15 +48,17 @@ if root_dir not in sys.path:
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.exceptions import RequestValidationError
 import time
 from contextlib import asynccontextmanager
-from typing import Dict, Any, AsyncGenerator
+from typing import Dict, Any, AsyncGenerator, Optional
 import uuid
 import contextvars
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import traceback
 from sqlalchemy.sql import text
+import redis.asyncio as redis
 
 # Disable SQLAlchemy's built-in logging at module load time
 db_logger = get_logger('sqlalchemy')
@@ -80,13 +82,13 @@ from .api.api import api_router
 from .core.config import settings
 from .db.db import database, init_db, engine
 from .core.exceptions import APIException, api_exception_handler, validation_exception_handler
+from .cache import configure_cache, cleanup_cache, ping_cache
 
 # Create a context variable for request IDs
 request_id_var = contextvars.ContextVar("request_id", default=None)
 
-# Initialize Redis client if enabled - Redis is disabled for now
-redis_client = None
-logger.info("Redis is disabled. Skipping Redis initialization.")
+# Redis client is created in lifespan when REDIS_ENABLED is set
+redis_client: Optional[redis.Redis] = None
 
 
 # Определяем функцию lifespan
@@ -122,6 +124,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.error(f"[bold red]Database initialization error: {str(e)}[/bold red]", exc_info=True)
         logger.warning("Unable to initialize database. Application may not work properly.")
 
+    # Connect to Redis
+    global redis_client
+    if settings.REDIS_ENABLED:
+        redis_client = redis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            password=settings.REDIS_PASSWORD or None,
+            db=settings.REDIS_DB,
+        )
+        configure_cache(redis_client)
+        # Недоступный Redis не мешает старту: кеш сам откатывается к запросам в БД
+        if not await ping_cache():
+            logger.warning("Redis is not reachable, requests will bypass the cache until it is")
+    else:
+        logger.info("Redis is disabled. Skipping Redis initialization.")
+
     yield  # Application runs here
 
     # Shutdown: runs at application shutdown
@@ -134,13 +152,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error(f"[bold red]Error disconnecting from database: {e}[/bold red]")
 
-    # Redis is disabled for now
-    # # Закрываем соединение с Redis
-    # if redis_client:
-    #     logger.info("Cleaning up cache connections")
-    #     await cleanup_cache()
-    #     await redis_client.close()
-    #     logger.info("Redis connection closed")
+    # Закрываем соединение с Redis
+    if redis_client:
+        logger.info("Cleaning up cache connections")
+        await cleanup_cache()
+        await redis_client.aclose()
+        redis_client = None
+        logger.info("Redis connection closed")
 
 
 # Создаем FastAPI приложение
@@ -151,6 +169,7 @@ app = FastAPI(
     openapi_url="/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -163,6 +182,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Сжимаем крупные ответы (списки курсов, деревья технологий); мелкие ответы отдаются как есть
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 
 # Объединенный middleware для обработки запросов и добавления метаданных
 @app.middleware("http")
@@ -226,7 +248,8 @@ setup_request_logging(
          response_model=Dict[str, Any],
          tags=["monitoring"],
          summary="API health check",
-         response_description="Базовый статус сервиса")
+         response_description="Базовый статус сервиса",
+         include_in_schema=False)
 async def health_check():
     """
     Базовый эндпоинт для проверки работоспособности сервиса.
@@ -242,8 +265,9 @@ async def health_check():
         logger.error(f"[bold red]Database health check failed: {str(e)}[/bold red]")
         db_status = "error"
 
-    # Redis is disabled
-    redis_status = "disabled"
+    # Check Redis connection
+    redis_ok = await ping_cache()
+    redis_status = "disabled" if redis_ok is None else ("ok" if redis_ok else "error")
 
     return {
         "status": "ok" if db_status == "ok" else "error",
@@ -34,7 +34,9 @@ class Article(Base):
         # Ensure unique combination of course_id and slug
         UniqueConstraint('course_id', 'slug', name='uq_article_course_slug'),
         # Add index for faster filtering by is_published
-        Index('ix_articles_is_published', 'is_published')
+        Index('ix_articles_is_published', 'is_published'),
+        # Add index for listing a course's articles in display order
+        Index('ix_articles_course_id_order', 'course_id', 'order')
     )
 
     def __repr__(self):
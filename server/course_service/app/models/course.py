@@ -9,17 +9,19 @@ from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 
 from app.models.base import Base
-from sqlalchemy import Column, DateTime, ForeignKey, String, Table, Index, Boolean, Enum
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, Computed, DateTime, ForeignKey, String, Table, Index, Boolean, Enum
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.ext.declarative import declared_attr
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 # Связующая таблица между курсами и тегами
 course_tag = Table(
     "course_tag",
     Base.metadata,
     Column("course_id", UUID(as_uuid=True), ForeignKey("courses.id"), primary_key=True),
-    Column("tag_id", UUID(as_uuid=True), ForeignKey("tags.id"), primary_key=True)
+    Column("tag_id", UUID(as_uuid=True), ForeignKey("tags.id"), primary_key=True),
+    # Первичный ключ (course_id, tag_id) не помогает искать курсы по тегу
+    Index("ix_course_tag_tag_id", "tag_id")
 )
 
 
@@ -61,6 +63,17 @@ class Course(Base):
     title = Column(JSONB, nullable=False)
     description = Column(JSONB, nullable=True)
 
+    # Полнотекстовый индекс по всем языкам названия и описания (конфигурация 'simple', без стемминга);
+    # вычисляется базой при записи и не загружается вместе с курсом
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "jsonb_to_tsvector('simple', title, '[\"string\"]') || "
+            "jsonb_to_tsvector('simple', coalesce(description, '{}'::jsonb), '[\"string\"]')",
+            persisted=True
+        )
+    ))
+
     # Внешний ключ на автора (user_id из сервиса auth)
     author_id = Column(UUID(as_uuid=True), nullable=False)
 
@@ -120,8 +133,8 @@ class Course(Base):
         # Добавляем индекс для slug
         indices.append(Index('ix_courses_slug', 'slug'))
 
-        # Добавляем индекс для автора
-        indices.append(Index('ix_courses_author_id', 'author_id'))
+        # Добавляем индекс для автора; created_at во втором столбце отдает курсы автора уже отсортированными
+        indices.append(Index('ix_courses_author_id_created_at', 'author_id', 'created_at'))
 
         # Добавляем индекс для is_published
         indices.append(Index('ix_courses_is_published', 'is_published'))
@@ -132,6 +145,12 @@ class Course(Base):
         # Добавляем индекс для organization_id
         indices.append(Index('ix_courses_organization_id', 'organization_id'))
 
+        # Индекс для keyset-пагинации по (created_at, id), читается в обе стороны
+        indices.append(Index('ix_courses_created_at_id', 'created_at', 'id'))
+
+        # GIN-индекс для полнотекстового поиска (search_courses)
+        indices.append(Index('ix_courses_search_vector', 'search_vector', postgresql_using='gin'))
+
         return tuple(indices)
 
     def __repr__(self):
@@ -1,106 +1,256 @@
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
+from app.cache import cache, course_cache_tag, delete_cached, invalidate_tag
 from app.models.article import Article
+from app.models.course import Course
 from app.schemas.article import ArticleCreate, ArticleUpdate
-from sqlalchemy import select, func, update, delete
+from sqlalchemy import bindparam, cast, exists, literal, select, func, or_, union, update, delete
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Statements built once and reused with bound parameters on every call
+_SELECT_ARTICLE_BY_ID = select(Article).where(Article.id == bindparam("article_id"))
+_SELECT_ARTICLE_BY_SLUG = select(Article).where(
+    Article.course_id == bindparam("course_id"),
+    Article.slug == bindparam("slug")
+)
+
+# JSONB fields holding {language_code: text}; updates merge into them instead of replacing them
+_MULTILINGUAL_FIELDS = ("title", "description", "content")
+_EMPTY_JSONB = cast({}, JSONB)
+
+
+def _localized_column(column, language: str, fallback: bool, default: Optional[str] = None):
+    """
+    SQL expression for one language of a multilingual JSONB column
+
+    With fallback, a missing language falls back to the first stored value, like Article.get_title().
+    """
+    value = column[language].astext
+    options = [value]
+    if fallback:
+        entries = func.jsonb_each_text(column).table_valued("key", "value")
+        options.append(select(entries.c.value).limit(1).scalar_subquery())
+    if default is not None:
+        options.append(literal(default))
+    return func.coalesce(*options) if len(options) > 1 else value
+
+
+def _article_languages_key(repo: "ArticleRepository", article_id: UUID) -> str:
+    """Cache key for the language list of an article"""
+    return f"article_languages:{article_id}"
+
 
 class ArticleRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create_article(self, course_id: UUID, article_data: ArticleCreate) -> Article:
-        article = Article(
-            course_id=course_id,
-            slug=article_data.slug,
-            title=article_data.title,
-            content=article_data.content,
-            description=article_data.description,
-            order=article_data.order,
-            is_published=article_data.is_published
+    async def create_article(self, course_id: UUID, article_data: ArticleCreate) -> Optional[Article]:
+        """
+        Create an article; returns None if the slug is already taken in the course
+
+        The unique (course_id, slug) constraint is enforced by INSERT ... ON CONFLICT DO NOTHING,
+        so concurrent creates with the same slug cannot both succeed.
+        """
+        result = await self.session.execute(
+            pg_insert(Article)
+            .values(
+                course_id=course_id,
+                slug=article_data.slug,
+                title=article_data.title,
+                content=article_data.content,
+                description=article_data.description,
+                order=article_data.order,
+                is_published=article_data.is_published
+            )
+            .on_conflict_do_nothing(constraint="uq_article_course_slug")
+            .returning(Article)
         )
-        self.session.add(article)
+        article = result.scalars().first()
         await self.session.commit()
-        await self.session.refresh(article)
         return article
 
     async def get_article(self, article_id: UUID) -> Optional[Article]:
-        result = await self.session.execute(
-            select(Article).where(Article.id == article_id)
-        )
+        result = await self.session.execute(_SELECT_ARTICLE_BY_ID, {"article_id": article_id})
         return result.scalars().first()
 
+    async def get_article_version(self, article_id: UUID) -> Optional[datetime]:
+        """
+        Get only the last modification time of an article (for ETag checks)
+
+        Args:
+            article_id: UUID of the article
+
+        Returns:
+            updated_at of the article, or None if the article is not found
+        """
+        result = await self.session.execute(select(Article.updated_at).where(Article.id == article_id))
+        return result.scalar_one_or_none()
+
     async def get_article_by_slug(self, course_id: UUID, slug: str) -> Optional[Article]:
         result = await self.session.execute(
-            select(Article).where(
-                Article.course_id == course_id,
-                Article.slug == slug
-            )
+            _SELECT_ARTICLE_BY_SLUG,
+            {"course_id": course_id, "slug": slug}
         )
         return result.scalars().first()
 
+    async def course_exists(self, course_id: UUID) -> bool:
+        """
+        Check that the course an article belongs to exists
+
+        Args:
+            course_id: UUID of the course
+
+        Returns:
+            True if the course exists, False otherwise
+        """
+        result = await self.session.execute(select(exists().where(Course.id == course_id)))
+        return result.scalar()
+
+    async def get_localized(self, article_id: UUID, language: str, fallback: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get an article in one language, selecting only that language from the JSONB fields
+
+        Args:
+            article_id: UUID of the article
+            language: ISO language code (e.g., 'en', 'ru')
+            fallback: If True, fields missing the language fall back to the first stored value
+
+        Returns:
+            Dictionary like Article.get_localized_version() plus "has_language"
+            (whether any field has the language), or None if the article is not found
+        """
+        result = await self.session.execute(
+            select(
+                Article.id,
+                Article.course_id,
+                Article.slug,
+                _localized_column(Article.title, language, fallback, default="").label("title"),
+                _localized_column(Article.description, language, fallback).label("description"),
+                _localized_column(Article.content, language, fallback, default="").label("content"),
+                Article.order,
+                Article.is_published,
+                Article.created_at,
+                Article.updated_at,
+                or_(
+                    Article.title.has_key(language),
+                    Article.description.has_key(language),
+                    Article.content.has_key(language)
+                ).label("has_language")
+            ).where(Article.id == article_id)
+        )
+        row = result.mappings().first()
+        return dict(row) if row else None
+
     async def get_articles(self,
                            course_id: UUID,
                            skip: int = 0,
                            limit: int = 100,
                            language: Optional[str] = None,
                            is_published: Optional[bool] = None) -> tuple[List[Article], int]:
-        query = select(Article).where(Article.course_id == course_id)
+        # The window count returns the total of all matching rows next to every row of the page
+        query = select(Article, func.count().over().label("total")).where(Article.course_id == course_id)
 
-        # We can't filter by language directly since it's in JSONB
-        # Language filtering will be done in the API layer
+        # Keep only articles with the language in any multilingual field (JSONB "?" operator),
+        # matching Article.available_languages()
+        if language:
+            query = query.where(or_(
+                Article.title.has_key(language),
+                Article.description.has_key(language),
+                Article.content.has_key(language)
+            ))
 
         if is_published is not None:
             query = query.where(Article.is_published == is_published)
 
-        # Count total articles matching filters
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await self.session.execute(count_query)
-        total_count = total.scalar() or 0
-
         # Apply pagination
-        query = query.order_by(Article.order).offset(skip).limit(limit)
-
-        result = await self.session.execute(query)
-        articles = result.scalars().all()
+        page_query = query.order_by(Article.order).offset(skip).limit(limit)
 
-        # Filter by language if specified
-        if language and articles:
-            # We'll keep all articles but later in the API we can filter
-            # the content based on the requested language
-            pass
+        result = await self.session.execute(page_query)
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
 
-        return articles, total_count
+        # An empty page carries no window count; a page past the end still needs the real total
+        if skip == 0:
+            return [], 0
+        count_query = select(func.count()).select_from(query.with_only_columns(Article.id).subquery())
+        total = await self.session.execute(count_query)
+        return [], total.scalar() or 0
 
     async def update_article(self, article_id: UUID, article_data: ArticleUpdate) -> Optional[Article]:
+        """
+        Update an article in a single UPDATE ... RETURNING statement
+
+        Returns:
+            Updated article, or None if the article is not found
+
+        Raises:
+            ValueError: If the new slug is already used by another article of the course
+        """
         update_data = article_data.model_dump(exclude_unset=True)
 
         if not update_data:
             # If no data to update, just return the current article
             return await self.get_article(article_id)
 
-        await self.session.execute(
-            update(Article)
-            .where(Article.id == article_id)
-            .values(**update_data)
-        )
+        # Multilingual fields are merged in the database (jsonb ||), so only the
+        # provided languages are sent and the other languages are kept
+        for field in _MULTILINGUAL_FIELDS:
+            patch = update_data.get(field)
+            if patch:
+                column = getattr(Article, field)
+                update_data[field] = func.coalesce(column, _EMPTY_JSONB).op("||")(
+                    bindparam(f"{field}_patch", patch, type_=JSONB)
+                )
+
+        # UPDATE ... RETURNING: the existence check and the reload happen in the same statement,
+        # and a slug conflict is reported by the unique constraint
+        try:
+            result = await self.session.execute(
+                update(Article)
+                .where(Article.id == article_id)
+                .values(**update_data)
+                .returning(Article)
+            )
+        except IntegrityError as e:
+            await self.session.rollback()
+            if "uq_article_course_slug" in str(e.orig):
+                raise ValueError("Another article with this slug already exists") from e
+            raise
+        article = result.scalars().first()
         await self.session.commit()
+        await delete_cached(_article_languages_key(self, article_id))
 
-        return await self.get_article(article_id)
+        return article
 
     async def delete_article(self, article_id: UUID) -> bool:
         result = await self.session.execute(
-            delete(Article).where(Article.id == article_id)
+            delete(Article).where(Article.id == article_id).returning(Article.course_id)
         )
+        course_id = result.scalar_one_or_none()
         await self.session.commit()
-        return result.rowcount > 0
+        await delete_cached(_article_languages_key(self, article_id))
+        if course_id is None:
+            return False
+        # Кэшированные уроки курса содержат article_ids, а связи со статьей удалены каскадом
+        await invalidate_tag(course_cache_tag(course_id))
+        return True
         
+    @cache(key_builder=_article_languages_key)
     async def get_article_languages(self, article_id: UUID) -> List[str]:
         """Get list of languages available for an article"""
-        article = await self.get_article(article_id)
-        if not article:
-            return []
-        
-        return article.available_languages()
+        # Same result as Article.available_languages(), but only the JSONB keys are read:
+        # UNION of the keys of all multilingual fields, deduplicated and sorted by the database
+        languages = union(*(
+            select(func.jsonb_object_keys(getattr(Article, field)).label("language"))
+            .where(Article.id == article_id)
+            for field in _MULTILINGUAL_FIELDS
+        )).subquery()
+        result = await self.session.execute(
+            select(languages.c.language).order_by(languages.c.language)
+        )
+        return list(result.scalars().all())
@@ -4,8 +4,10 @@ from uuid import UUID
 from app.models.lesson import Lesson, lesson_article
 from app.models.article import Article
 from app.schemas.lesson import LessonCreate, LessonUpdate
-from sqlalchemy import select, func, update, delete, insert, and_, or_
+from sqlalchemy import select, func, update, delete, and_, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 
 class LessonRepository:
@@ -34,8 +36,9 @@ class LessonRepository:
 
     async def get_lesson(self, lesson_id: UUID) -> Optional[Lesson]:
         """Get a lesson by ID."""
+        # article_ids читается из связи articles, поэтому она грузится сразу (ленивая загрузка в async недоступна)
         result = await self.session.execute(
-            select(Lesson).where(Lesson.id == lesson_id)
+            select(Lesson).where(Lesson.id == lesson_id).options(selectinload(Lesson.articles))
         )
         return result.scalars().first()
 
@@ -85,7 +88,7 @@ class LessonRepository:
         total_count = total.scalar() or 0
 
         # Apply pagination
-        query = query.order_by(Lesson.order).offset(skip).limit(limit)
+        query = query.order_by(Lesson.order).offset(skip).limit(limit).options(selectinload(Lesson.articles))
 
         result = await self.session.execute(query)
         lessons = result.scalars().all()
@@ -109,48 +112,56 @@ class LessonRepository:
 
         return await self.get_lesson(lesson_id)
 
-    async def delete_lesson(self, lesson_id: UUID) -> bool:
-        """Delete a lesson by ID."""
+    async def delete_lesson(self, lesson_id: UUID) -> Optional[UUID]:
+        """Delete a lesson by ID. Returns the course ID of the deleted lesson, or None if it did not exist."""
         result = await self.session.execute(
-            delete(Lesson).where(Lesson.id == lesson_id)
+            delete(Lesson).where(Lesson.id == lesson_id).returning(Lesson.course_id)
         )
+        course_id = result.scalar_one_or_none()
         await self.session.commit()
-        return result.rowcount > 0
+        return course_id
 
-    async def add_article_to_lesson(self, lesson_id: UUID, article_id: UUID) -> bool:
-        """Associate an article with a lesson."""
-        # Check if the association already exists
+    async def add_article_to_lesson(self, lesson_id: UUID, article_id: UUID) -> Optional[UUID]:
+        """
+        Associate an article with a lesson.
+
+        Returns the course ID if both exist and belong to the same course (the association is
+        added or already present), otherwise None.
+        """
+        # Урок и статья проверяются одним запросом; существующая связь не ищется отдельно,
+        # повторная вставка просто игнорируется
         result = await self.session.execute(
-            select(lesson_article).where(
-                lesson_article.c.lesson_id == lesson_id,
-                lesson_article.c.article_id == article_id
-            )
+            select(Lesson.course_id)
+            .join(Article, Article.course_id == Lesson.course_id)
+            .where(Lesson.id == lesson_id, Article.id == article_id)
         )
+        course_id = result.scalar_one_or_none()
+        if course_id is None:
+            return None
 
-        if result.first():
-            # Association already exists
-            return True
-
-        # Add the association
         await self.session.execute(
-            insert(lesson_article).values(
-                lesson_id=lesson_id,
-                article_id=article_id
-            )
+            pg_insert(lesson_article)
+            .values(lesson_id=lesson_id, article_id=article_id)
+            .on_conflict_do_nothing()
         )
         await self.session.commit()
-        return True
+        return course_id
 
-    async def remove_article_from_lesson(self, lesson_id: UUID, article_id: UUID) -> bool:
-        """Remove an article association from a lesson."""
+    async def remove_article_from_lesson(self, lesson_id: UUID, article_id: UUID) -> Optional[UUID]:
+        """Remove an article association from a lesson. Returns the lesson's course ID, or None if nothing was removed."""
         result = await self.session.execute(
-            delete(lesson_article).where(
+            delete(lesson_article)
+            .where(
                 lesson_article.c.lesson_id == lesson_id,
                 lesson_article.c.article_id == article_id
             )
+            .returning(
+                select(Lesson.course_id).where(Lesson.id == lesson_article.c.lesson_id).scalar_subquery()
+            )
         )
+        course_id = result.scalar_one_or_none()
         await self.session.commit()
-        return result.rowcount > 0
+        return course_id
 
     async def get_lesson_articles(self, lesson_id: UUID) -> List[Article]:
         """Get all articles associated with a lesson."""
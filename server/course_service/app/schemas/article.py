@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional, List, Dict
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Base Article Schema
@@ -42,8 +42,7 @@ class ArticleResponse(ArticleBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Schema for listing articles
@@ -52,8 +51,7 @@ class ArticleListResponse(BaseModel):
     items: List[ArticleResponse]
     total: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Schema for localized article response
@@ -71,8 +69,7 @@ class ArticleLocalizedResponse(BaseModel):
     updated_at: datetime
     language: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Schema for article language information
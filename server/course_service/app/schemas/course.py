@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Union, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from ..models.course import CourseVisibility
 
@@ -97,15 +97,21 @@ class CourseVisibilityUpdate(BaseModel):
         description="Organization ID (required if visibility is ORGANIZATION)"
     )
 
-    @field_validator('organization_id')
-    @classmethod
-    def validate_organization_id(cls, v, values):
-        """Validate that organization_id is provided if visibility is ORGANIZATION"""
-        if values.data.get('visibility') == CourseVisibility.ORGANIZATION and not v:
-            raise ValueError(
-                "organization_id is required when visibility is set to ORGANIZATION"
-            )
-        return v
+    @model_validator(mode='after')
+    def validate_organization_id(self) -> 'CourseVisibilityUpdate':
+        """
+        Require organization_id for ORGANIZATION visibility and drop it for other levels
+
+        Runs on the whole model, so a missing organization_id is caught too.
+        """
+        if self.visibility == CourseVisibility.ORGANIZATION:
+            if not self.organization_id:
+                raise ValueError(
+                    "organization_id is required when visibility is set to ORGANIZATION"
+                )
+        else:
+            self.organization_id = None
+        return self
 
 
 class CourseInDB(CourseBase):
@@ -210,10 +216,11 @@ class CourseResponse(CourseWithLanguageUtils):
 class CourseList(BaseModel):
     """Schema for paginated list of courses"""
     items: List[Course]
-    total: int
+    total: Optional[int] = Field(None, description="Number of matching courses (null when paging by cursor without with_total=true)")
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = Field(None, description="Number of pages (null when paging by cursor without with_total=true)")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (sorting by created_at only)")
 
 
 # Extended schema for search/filtering parameters
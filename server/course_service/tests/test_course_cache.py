@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for Redis caching of courses, run against an in-memory Redis stand-in
+"""
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.cache as cache_module
+from app.api import deps
+from app.core.config import settings
+from app.crud.course import course_crud
+from app.main import app
+
+
+class FakePipeline:
+    """Buffers commands like redis.asyncio pipelines do and applies them on execute"""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def setex(self, key, ttl, value):
+        self._commands.append(lambda: self._redis.set_value(key, ttl, value))
+
+    def sadd(self, key, member):
+        self._commands.append(lambda: self._redis.sets.setdefault(key, set()).add(member))
+
+    def expire(self, key, ttl):
+        self._commands.append(lambda: self._redis.ttls.__setitem__(key, ttl))
+
+    async def execute(self):
+        return [command() for command in self._commands]
+
+
+class FakeRedis:
+    """Minimal subset of redis.asyncio.Redis used by app.cache"""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+        self.ttls = {}
+
+    def set_value(self, key, ttl, value):
+        self.values[key] = value.encode() if isinstance(value, str) else value
+        self.ttls[key] = ttl
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    async def sunion(self, *keys):
+        return set().union(*(self.sets.get(key, set()) for key in keys))
+
+    async def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            deleted += (self.values.pop(key, None) is not None) + (self.sets.pop(key, None) is not None)
+            self.ttls.pop(key, None)
+        return deleted
+
+    async def ping(self):
+        return True
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Enable the cache backed by FakeRedis for the duration of a test"""
+    redis = FakeRedis()
+    monkeypatch.setattr(settings, "REDIS_ENABLED", True)
+    monkeypatch.setattr(cache_module, "_redis_client", redis)
+    return redis
+
+
+def test_cache_is_noop_when_disabled(monkeypatch):
+    """Without Redis every helper degrades to a miss"""
+    monkeypatch.setattr(settings, "REDIS_ENABLED", False)
+
+    asyncio.run(cache_module.set_cached("key", "value"))
+
+    assert asyncio.run(cache_module.get_cached("key")) is None
+    assert asyncio.run(cache_module.invalidate_tag("tag")) == 0
+    assert asyncio.run(cache_module.ping_cache()) is None
+
+
+def test_set_and_get_cached(fake_redis):
+    """Stored value is returned as str and tagged with a TTL not shorter than its key"""
+    asyncio.run(cache_module.set_cached("key", "value", expire=10 * settings.CACHE_EXPIRE_IN_SECONDS, tag="tag"))
+
+    assert asyncio.run(cache_module.get_cached("key")) == "value"
+    assert fake_redis.sets["tag"] == {"key"}
+    assert fake_redis.ttls["tag"] >= fake_redis.ttls["key"]
+
+
+def test_invalidate_tag_removes_only_tagged_keys(fake_redis):
+    """invalidate_tag drops the keys of the given tags and the tag sets themselves"""
+    asyncio.run(cache_module.set_cached("a", "1", tag="first"))
+    asyncio.run(cache_module.set_cached("b", "2", tag="second"))
+
+    assert asyncio.run(cache_module.invalidate_tag("first")) == 2
+
+    assert asyncio.run(cache_module.get_cached("a")) is None
+    assert asyncio.run(cache_module.get_cached("b")) == "2"
+    assert "first" not in fake_redis.sets
+
+
+def test_delete_cached_removes_exact_key(fake_redis):
+    """delete_cached drops one key with a plain DEL, without scanning the keyspace"""
+    asyncio.run(cache_module.set_cached("article:1:languages", "[]"))
+    asyncio.run(cache_module.set_cached("article:10:languages", "[]"))
+
+    assert asyncio.run(cache_module.delete_cached("article:1:languages")) == 1
+
+    assert asyncio.run(cache_module.get_cached("article:1:languages")) is None
+    assert asyncio.run(cache_module.get_cached("article:10:languages")) == "[]"
+
+
+@pytest.fixture
+def course():
+    """Course returned by the patched CRUD"""
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        id=uuid.uuid4(), slug="cached-course", title={"en": "Title"}, description={"en": "Description"},
+        author_id=uuid.uuid4(), created_at=now, updated_at=now, tags=[]
+    )
+
+
+@pytest.fixture
+def client(monkeypatch, course):
+    """TestClient with the database replaced by CRUD stubs that count their calls"""
+    calls = []
+
+    async def search_courses(db, params, skip=0, limit=10, after=None, compute_total=True):
+        calls.append("search")
+        return [course], 1
+
+    async def get_course(db, course_id):
+        calls.append("get")
+        return course
+
+    async def delete_course(db, course_id):
+        return True
+
+    async def get_db():
+        yield None
+
+    monkeypatch.setattr(course_crud, "search_courses", search_courses)
+    monkeypatch.setattr(course_crud, "get_course", get_course)
+    monkeypatch.setattr(course_crud, "delete_course", delete_course)
+    app.dependency_overrides[deps.get_db] = get_db
+    app.dependency_overrides[deps.verify_token] = lambda: True
+    try:
+        yield TestClient(app), calls
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_course_list_and_course_are_served_from_cache(fake_redis, client, course):
+    """Repeated reads hit the cache, deleting the course invalidates both the list and the course"""
+    test_client, calls = client
+
+    first_list = test_client.get("/?size=5")
+    assert test_client.get("/?size=5").json() == first_list.json()
+    first_course = test_client.get(f"/?uuid={course.id}")
+    assert test_client.get(f"/?uuid={course.id}").json() == first_course.json()
+    assert calls == ["search", "get"]
+
+    assert test_client.delete(f"/{course.id}").status_code == 200
+
+    test_client.get("/?size=5")
+    test_client.get(f"/?uuid={course.id}")
+    assert calls == ["search", "get", "search", "get"]
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for keyset pagination cursors of the course list
+"""
+import base64
+import json
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.endpoints.courses import _decode_cursor, _encode_cursor
+
+
+def _raw_cursor(payload) -> str:
+    """Build a cursor from an arbitrary JSON payload"""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def test_cursor_round_trip():
+    """Decoded cursor points to the course it was built from"""
+    course = SimpleNamespace(
+        id=uuid.uuid4(),
+        created_at=datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+    )
+
+    assert _decode_cursor(_encode_cursor(course)) == (course.created_at, course.id)
+
+
+def test_cursor_without_timezone_is_utc():
+    """Naive timestamp is treated as UTC so it can be compared with created_at"""
+    course_id = uuid.uuid4()
+
+    created_at, decoded_id = _decode_cursor(_raw_cursor(["2024-05-01T12:30:15", str(course_id)]))
+
+    assert created_at == datetime(2024, 5, 1, 12, 30, 15, tzinfo=timezone.utc)
+    assert decoded_id == course_id
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor!",
+    base64.urlsafe_b64encode(b"not json").decode(),
+    _raw_cursor(["2024-05-01T12:30:15+00:00"]),
+    _raw_cursor(["2024-05-01T12:30:15+00:00", str(uuid.uuid4()), "extra"]),
+    _raw_cursor({"created_at": "2024-05-01T12:30:15+00:00"}),
+    _raw_cursor(["2024-05-01T12:30:15+00:00", 42]),
+    _raw_cursor(["2024-05-01T12:30:15+00:00", [str(uuid.uuid4())]]),
+    _raw_cursor([1714566615, str(uuid.uuid4())]),
+    _raw_cursor(["yesterday", str(uuid.uuid4())]),
+    _raw_cursor(["2024-05-01T12:30:15+00:00", "not-a-uuid"]),
+    _raw_cursor(None),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    """Malformed cursors are a client error, not a 500"""
+    with pytest.raises(HTTPException) as exc_info:
+        _decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
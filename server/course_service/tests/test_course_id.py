@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for telling course UUIDs from slugs
+"""
+import uuid
+
+import pytest
+
+from app.crud.course import parse_course_id
+
+
+def test_canonical_uuid_is_parsed():
+    """Canonical UUID in any case is recognised as an ID"""
+    course_id = uuid.uuid4()
+
+    assert parse_course_id(str(course_id)) == course_id
+    assert parse_course_id(str(course_id).upper()) == course_id
+
+
+@pytest.mark.parametrize("value", [
+    "introduction-to-programming",
+    f"{uuid.uuid4()}\n",
+    f"{uuid.uuid4()}-extra",
+    f" {uuid.uuid4()}",
+    uuid.uuid4().hex,
+])
+def test_anything_else_is_a_slug(value):
+    """Only an exact canonical UUID is an ID; everything else is looked up as a slug"""
+    assert parse_course_id(value) is None
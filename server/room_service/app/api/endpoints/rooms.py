@@ -227,15 +227,15 @@ async def delete_room(
     
     Only the room owner can delete a room.
     """
-    room = await room_crud.get(db=db, room_id=room_id)
-    if not room:
+    owner_id = await room_crud.get_owner_id(db=db, room_id=room_id)
+    if not owner_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
         )
     
     # Проверка, является ли пользователь владельцем
-    if room.owner_id != current_user["id"]:
+    if owner_id != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only room owner can delete a room"
@@ -308,40 +308,32 @@ async def join_room_by_code(
     
     # Проверяем максимальное количество участников, если оно установлено
     if room.max_participants > 0:
-        participants, total = await room_participant_crud.get_room_participants(
-            db=db, 
-            room_id=room.id,
-            skip=0,
-            limit=1000  # Большое значение, чтобы получить всех участников
-        )
+        total = await room_participant_crud.count_room_participants(db=db, room_id=room.id)
         if total >= room.max_participants:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Room has reached maximum number of participants"
             )
     
-    # Проверяем, не состоит ли пользователь уже в комнате
-    existing_participant = await room_participant_crud.get(db=db, room_id=room.id, user_id=current_user["id"])
-    if existing_participant:
-        return {
-            "room_id": room.id,
-            "joined": False,
-            "message": "You are already a participant in this room"
-        }
-    
-    # Добавляем пользователя как участника
+    # Добавляем пользователя как участника.
+    # Первичный ключ (room_id, user_id) не дает добавить участника повторно,
+    # поэтому отдельная проверка перед вставкой не нужна
     participant_data = RoomParticipantCreate(
         user_id=current_user["id"],
         role=RoomParticipantRole.STUDENT,
         participant_metadata={}
     )
     
-    participant = await room_participant_crud.create(db=db, room_id=room.id, obj_in=participant_data)
+    # rollback внутри create при повторном входе истекает загруженную комнату,
+    # а ленивое обновление атрибутов в AsyncSession невозможно — ID читаем заранее
+    room_id = room.id
+    participant = await room_participant_crud.create(db=db, room_id=room_id, obj_in=participant_data)
     if not participant:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to join the room"
-        )
+        return {
+            "room_id": room_id,
+            "joined": False,
+            "message": "You are already a participant in this room"
+        }
     
     # Если комната была в состоянии PENDING, меняем ее на ACTIVE после присоединения первого участника
     if room.status == RoomStatus.PENDING:
@@ -351,9 +343,9 @@ async def join_room_by_code(
             obj_in=RoomUpdate(status=RoomStatus.ACTIVE)
         )
     
-    logger.info(f"User {current_user['id']} successfully joined room {room.id} with code {join_data.code}")
+    logger.info(f"User {current_user['id']} successfully joined room {room_id} with code {join_data.code}")
     return {
-        "room_id": room.id,
+        "room_id": room_id,
         "joined": True,
         "message": "Successfully joined the room"
     }
@@ -372,8 +364,7 @@ async def get_room_participants(
     Get a list of participants in a room.
     """
     # Проверяем существование комнаты
-    room = await room_crud.get(db=db, room_id=room_id)
-    if not room:
+    if not await room_crud.exists(db=db, room_id=room_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
@@ -426,32 +417,19 @@ async def add_room_participant(
     
     # Проверяем максимальное количество участников, если оно установлено
     if room.max_participants > 0:
-        participants, total = await room_participant_crud.get_room_participants(
-            db=db, 
-            room_id=room.id,
-            skip=0,
-            limit=1000
-        )
+        total = await room_participant_crud.count_room_participants(db=db, room_id=room.id)
         if total >= room.max_participants:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Room has reached maximum number of participants"
             )
     
-    # Проверяем, не существует ли уже участник
-    existing_participant = await room_participant_crud.get(db=db, room_id=room_id, user_id=participant_in.user_id)
-    if existing_participant:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="User is already a participant in this room"
-        )
-    
-    # Добавляем участника
+    # Добавляем участника (повтор отклоняется первичным ключом (room_id, user_id))
     new_participant = await room_participant_crud.create(db=db, room_id=room_id, obj_in=participant_in)
     if not new_participant:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to add participant"
+            status_code=status.HTTP_409_CONFLICT,
+            detail="User is already a participant in this room"
         )
     
     return new_participant
@@ -472,8 +450,7 @@ async def update_room_participant(
     Only room owner can change participant roles.
     """
     # Проверяем существование комнаты
-    room = await room_crud.get(db=db, room_id=room_id)
-    if not room:
+    if not await room_crud.exists(db=db, room_id=room_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
@@ -496,7 +473,7 @@ async def update_room_participant(
         )
     
     # Запрещаем менять роль владельца
-    if participant_to_update.role == RoomParticipantRole.OWNER and "role" in participant_in.dict(exclude_unset=True):
+    if participant_to_update.role == RoomParticipantRole.OWNER and "role" in participant_in.model_dump(exclude_unset=True):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Cannot change the role of the room owner"
@@ -528,8 +505,7 @@ async def remove_room_participant(
     Owner cannot be removed.
     """
     # Проверяем существование комнаты
-    room = await room_crud.get(db=db, room_id=room_id)
-    if not room:
+    if not await room_crud.exists(db=db, room_id=room_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
@@ -580,8 +556,7 @@ async def create_progress_record(
     Teachers and owners can create progress records for any participant.
     """
     # Проверяем существование комнаты
-    room = await room_crud.get(db=db, room_id=room_id)
-    if not room:
+    if not await room_crud.exists(db=db, room_id=room_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
@@ -604,22 +579,14 @@ async def create_progress_record(
             detail="User is not a participant in this room"
         )
     
-    # Проверяем, существует ли уже запись о прогрессе для этого узла
-    existing_progress = await room_progress_crud.get_by_node(
-        db=db, 
-        room_id=room_id, 
-        user_id=progress_in.user_id, 
-        node_id=progress_in.node_id
-    )
-    
-    if existing_progress:
+    # Создаем запись о прогрессе (дубликат отклоняется уникальным индексом
+    # ix_room_progress_unique по room_id, user_id, node_id)
+    progress = await room_progress_crud.create(db=db, room_id=room_id, obj_in=progress_in)
+    if not progress:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Progress record already exists for this node"
         )
-    
-    # Создаем запись о прогрессе
-    progress = await room_progress_crud.create(db=db, room_id=room_id, obj_in=progress_in)
     return progress
 
 
@@ -638,8 +605,7 @@ async def get_user_progress(
     Teachers and owners can view progress of any participant.
     """
     # Проверяем существование комнаты
-    room = await room_crud.get(db=db, room_id=room_id)
-    if not room:
+    if not await room_crud.exists(db=db, room_id=room_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
@@ -683,8 +649,7 @@ async def update_progress_record(
     Teachers and owners can update progress of any participant.
     """
     # Проверяем существование комнаты
-    room = await room_crud.get(db=db, room_id=room_id)
-    if not room:
+    if not await room_crud.exists(db=db, room_id=room_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
@@ -726,8 +691,7 @@ async def delete_progress_record(
     Only teachers and owners can delete progress records.
     """
     # Проверяем существование комнаты
-    room = await room_crud.get(db=db, room_id=room_id)
-    if not room:
+    if not await room_crud.exists(db=db, room_id=room_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
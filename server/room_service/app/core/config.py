@@ -24,6 +24,9 @@ class Settings(BaseServiceSettings):
     # Настройки логирования SQL
     DB_ECHO: bool = os.getenv("DB_ECHO", "false").lower() == "true"
 
+    # Создание таблиц через create_all при старте (можно отключить, если схема уже развернута)
+    AUTO_CREATE_TABLES: bool = os.getenv("AUTO_CREATE_TABLES", "true").lower() == "true"
+
     # Настройки аутентификации
     AUTH_SECRET_KEY: str = os.getenv("AUTH_SECRET_KEY", "your-secret-key-for-jwt-tokens-must-be-set-in-production")
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
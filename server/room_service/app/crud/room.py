@@ -16,6 +16,12 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+# Имя первичного ключа (room_id, user_id) участников (имя по умолчанию в PostgreSQL);
+# нарушение именно этого ограничения означает повторное добавление участника
+_ROOM_PARTICIPANT_PK = "room_participants_pkey"
+# Уникальный индекс (room_id, user_id, node_id) прогресса; его нарушение означает повторную запись узла
+_ROOM_PROGRESS_UNIQUE = "ix_room_progress_unique"
+
 
 class RoomCRUD:
     """CRUD operations for Room model"""
@@ -93,6 +99,38 @@ class RoomCRUD:
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def exists(db: AsyncSession, room_id: uuid.UUID) -> bool:
+        """
+        Check that a room exists without loading the whole row
+
+        Args:
+            db: Database session
+            room_id: Room ID
+
+        Returns:
+            True if the room exists, False otherwise
+        """
+        query = select(Room.id).where(Room.id == room_id)
+        result = await db.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    @staticmethod
+    async def get_owner_id(db: AsyncSession, room_id: uuid.UUID) -> Optional[uuid.UUID]:
+        """
+        Get the owner ID of a room without loading the whole row
+
+        Args:
+            db: Database session
+            room_id: Room ID
+
+        Returns:
+            Owner ID if the room exists, None otherwise
+        """
+        query = select(Room.owner_id).where(Room.id == room_id)
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def get_by_code(db: AsyncSession, code: str) -> Optional[Room]:
         """
@@ -206,7 +244,7 @@ class RoomCRUD:
         if isinstance(obj_in, dict):
             update_data = obj_in.copy()
         else:
-            update_data = obj_in.dict(exclude_unset=True)
+            update_data = obj_in.model_dump(exclude_unset=True)
         
         # Список полей, которые нельзя изменять через API
         protected_fields = ["id", "code", "owner_id", "created_at"]
@@ -268,7 +306,10 @@ class RoomParticipantCRUD:
             obj_in: Participant data
 
         Returns:
-            Created participant if successful, None otherwise
+            Created participant if successful, None if the user is already a participant
+
+        Raises:
+            IntegrityError: If any other constraint is violated
         """
         obj_in_data = jsonable_encoder(obj_in, exclude_unset=True)
         db_obj = RoomParticipant(room_id=room_id, **obj_in_data)
@@ -278,9 +319,11 @@ class RoomParticipantCRUD:
             await db.commit()
             await db.refresh(db_obj)
             return db_obj
-        except IntegrityError:
+        except IntegrityError as e:
             await db.rollback()
-            return None
+            if _ROOM_PARTICIPANT_PK in str(e.orig):
+                return None
+            raise
 
     @staticmethod
     async def get(
@@ -341,6 +384,26 @@ class RoomParticipantCRUD:
 
         return participants, total
 
+    @staticmethod
+    async def count_room_participants(
+            db: AsyncSession,
+            *,
+            room_id: uuid.UUID
+    ) -> int:
+        """
+        Count participants in a room without loading them
+
+        Args:
+            db: Database session
+            room_id: Room ID
+
+        Returns:
+            Number of participants in the room
+        """
+        query = select(func.count()).select_from(RoomParticipant).where(RoomParticipant.room_id == room_id)
+        result = await db.execute(query)
+        return result.scalar_one()
+
     @staticmethod
     async def get_user_rooms(
             db: AsyncSession,
@@ -410,7 +473,7 @@ class RoomParticipantCRUD:
             Updated participant
         """
         obj_data = jsonable_encoder(db_obj)
-        update_data = obj_in.dict(exclude_unset=True)
+        update_data = obj_in.model_dump(exclude_unset=True)
 
         for field in obj_data:
             if field in update_data:
@@ -455,7 +518,7 @@ class RoomProgressCRUD:
             *,
             room_id: uuid.UUID,
             obj_in: RoomProgressCreate
-    ) -> RoomProgress:
+    ) -> Optional[RoomProgress]:
         """
         Create a new progress record
         
@@ -465,15 +528,24 @@ class RoomProgressCRUD:
             obj_in: Progress creation data
 
         Returns:
-            Created progress record
+            Created progress record, None if a record for this node already exists
+
+        Raises:
+            IntegrityError: If any other constraint is violated
         """
         obj_in_data = jsonable_encoder(obj_in, exclude_unset=True)
         db_obj = RoomProgress(room_id=room_id, **obj_in_data)
 
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+        try:
+            db.add(db_obj)
+            await db.commit()
+            await db.refresh(db_obj)
+            return db_obj
+        except IntegrityError as e:
+            await db.rollback()
+            if _ROOM_PROGRESS_UNIQUE in str(e.orig):
+                return None
+            raise
 
     @staticmethod
     async def get(
@@ -592,7 +664,7 @@ class RoomProgressCRUD:
             Updated progress record
         """
         obj_data = jsonable_encoder(db_obj)
-        update_data = obj_in.dict(exclude_unset=True)
+        update_data = obj_in.model_dump(exclude_unset=True)
 
         for field in obj_data:
             if field in update_data:
@@ -58,9 +58,10 @@ async def init_db():
         async with engine.begin() as conn:
             await conn.execute(text("SELECT 1"))
 
-        # Create tables
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        # Create tables; skipped when the schema is managed outside the service
+        if settings.AUTO_CREATE_TABLES:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
 
         return True
     except Exception as e:
@@ -218,7 +219,7 @@ class AsyncDatabaseManager:
 
         Эта функция:
         1. Проверяет подключение к базе данных
-        2. Создает все таблицы
+        2. Создает все таблицы (если включен AUTO_CREATE_TABLES)
         3. Загружает начальные данные, если они предоставлены
 
         Returns:
@@ -236,6 +237,11 @@ class AsyncDatabaseManager:
                 self.logger.error("Database connection test failed")
                 return False
 
+            # Схема развернута вне сервиса: никаких DDL (ни сброса схемы, ни create_all)
+            if not self.settings.AUTO_CREATE_TABLES:
+                self.logger.info("AUTO_CREATE_TABLES is disabled, skipping table creation")
+                return True
+
             # Импортируем модели и создаем таблицы
             self.logger.info("Preparing to create tables...")
 
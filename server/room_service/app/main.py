@@ -54,7 +54,7 @@ from contextlib import asynccontextmanager
 from typing import Dict, Any, AsyncGenerator
 import uuid
 import contextvars
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import traceback
 from sqlalchemy.sql import text
 
@@ -153,6 +153,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -6,7 +6,7 @@ from enum import Enum
 from typing import Dict, List, Optional, Any, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator, root_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from app.models.room import RoomStatus, RoomParticipantRole
 
@@ -135,8 +135,7 @@ class RoomResponse(RoomBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RoomDetailResponse(RoomResponse):
@@ -169,8 +168,7 @@ class RoomParticipantResponse(RoomParticipantBase):
     joined_at: datetime
     last_activity_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RoomProgressBase(BaseModel):
@@ -199,8 +197,7 @@ class RoomProgressResponse(RoomProgressBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RoomCodeJoin(BaseModel):